@@ -1,3 +1,9 @@
+import numpy as np
+
+# Below this many elements, sorted(set()) beats np.unique even for floats
+NUMPY_MIN_SIZE = 256
+
+
 class Solution:
     """
     Daily coding challenge solution.
@@ -6,15 +12,21 @@ class Solution:
     """
     def process_data(self, data: list) -> list:
         # Optimization algorithm
-        result = []
-        seen = set()
-        
-        for item in data:
-            if item not in seen:
-                seen.add(item)
-                result.append(item)
-                
-        return sorted(result)
+        # np.unique dedups and sorts in one C-level pass, but it only beats
+        # sorted(set()) for larger all-float input: CPython sorts a set of
+        # ints faster than NumPy, and small inputs don't repay the array
+        # conversion. Requiring plain floats also keeps the caller's element
+        # types (NumPy would convert ints and bools mixed in).
+        if (len(data) >= NUMPY_MIN_SIZE and type(data[0]) is float
+                and set(map(type, data)) == {float}):
+            arr = np.asarray(data, dtype=float)
+            # Strictly increasing input is already deduped and sorted
+            if (arr[1:] > arr[:-1]).all():
+                return list(data)
+            return np.unique(arr).tolist()
+
+        # Anything else: dedup with a set, then sort
+        return sorted(set(data))
 
     def validate_input(self, data):
         return data is not None and len(data) > 0
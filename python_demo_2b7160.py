@@ -7,60 +7,580 @@
 # Import necessary libraries for image creation and manipulation.
 # Pillow (PIL Fork) is a powerful image processing library.
 # If you don't have it, install it with: pip install Pillow
-from PIL import Image, ImageDraw
+# NumPy lets us generate and plot many points at once instead of one by one.
+# Install it with: pip install numpy
+import ctypes
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+# Numba is optional: it compiles the chaos-game loop to fast machine code.
+# Install it with: pip install numba
+# Without it, the loop is compiled as a tiny C library with gcc if a C compiler
+# is installed, and otherwise simply runs as regular (slower) Python.
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        # Stand-in decorator that leaves the function as plain Python.
+        def decorator(func):
+            return func
+        return decorator
+
+    # Without Numba, a "parallel range" is just a normal range.
+    prange = range
+
+# With Numba and an NVIDIA graphics card, big chaos games can also run on the GPU.
+HAVE_CUDA = False
+if HAVE_NUMBA:
+    try:
+        from numba import cuda
+        from numba.cuda.random import create_xoroshiro128p_states, xoroshiro128p_uniform_float32
+        HAVE_CUDA = cuda.is_available()
+    except Exception:
+        # No CUDA toolkit or driver: stay on the CPU.
+        HAVE_CUDA = False
+
+# --- Colors ---
+
+# The leaf color is a shade of blue that cycles every 5 recursion levels, so we
+# precompute the 5 possible colors once (a lookup table) and index into it
+# instead of redoing the arithmetic and building a new tuple on every draw.
+LEVEL_COLORS = tuple(
+    (50 + level * 10, 50 + level * 10, 255 - level * 10) for level in range(5)
+)
+
+# The image background.
+BACKGROUND_COLOR = (255, 255, 255)
+
+# While drawing, every pixel stores just one byte: its position in this palette
+# (0 is the background, 1 to 5 are the level colors). That is a third of the
+# memory of full RGB pixels. The real colors are looked up once, when saving.
+PALETTE = np.array((BACKGROUND_COLOR,) + LEVEL_COLORS, dtype=np.uint8)
+
+
+def level_color_index(level):
+    """Returns the palette index of the leaf color for a recursion level."""
+    return 1 + level % 5
+
+# --- Chaos Game Settings ---
+
+# How many chaos-game points to plot per smallest triangle of the requested level.
+# More points give a denser, smoother fractal at the cost of generation time.
+POINTS_PER_LEAF = 64
+
+# The palette index used for chaos-game points (the same blue as the recursive version).
+CHAOS_COLOR_INDEX = level_color_index(0)
+
+# The chaos game is split into this many independent walks so Numba can run
+# them on different CPU cores at the same time.
+CHAOS_CHUNKS = os.cpu_count() or 1
+
+# Chaos games with at least this many points run on the GPU when one is available.
+# Smaller ones finish faster on the CPU than it takes to copy the image around.
+GPU_MIN_POINTS = 1_000_000
+
+# On the GPU every thread runs its own walk; this is how many walks we launch
+# and how many threads are grouped into one block.
+GPU_WALKS = 65_536
+GPU_THREADS_PER_BLOCK = 256
 
 # --- Fractal Generation Function ---
 
-def draw_sierpinski_triangle(draw, point1, point2, point3, level):
+def fill_triangle(buf, point1, point2, point3, value):
     """
-    Recursively draws the Sierpinski Triangle.
+    Fills a triangle directly in a NumPy pixel buffer.
+
+    Instead of asking PIL to draw a polygon, we look only at the pixels inside
+    the triangle's bounding box and keep those that lie on the inner side of all
+    three edges (the "edge function" test used by graphics cards).
 
     Args:
-        draw: A PIL.ImageDraw.Draw object to draw on.
+        buf: A (height, width) uint8 NumPy array of palette indices
+             (or a (height, width, 3) array of RGB pixels).
+        point1, point2, point3: The (x, y) coordinates of the triangle's corners.
+        value: The palette index (or (r, g, b) color) to fill the triangle with.
+    """
+    height, width = buf.shape[:2]
+
+    # Integer bounding box of the triangle, clipped to the image.
+    x0 = max(int(min(point1[0], point2[0], point3[0])), 0)
+    x1 = min(int(max(point1[0], point2[0], point3[0])) + 1, width)
+    y0 = max(int(min(point1[1], point2[1], point3[1])), 0)
+    y1 = min(int(max(point1[1], point2[1], point3[1])) + 1, height)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    # Pixel coordinates of the bounding box as a column (ys) and a row (xs),
+    # which NumPy broadcasts into a full 2D grid.
+    ys, xs = np.ogrid[y0:y1, x0:x1]
+
+    # Each edge function tells us which side of an edge a pixel lies on.
+    def edge(a, b):
+        return (b[0] - a[0]) * (ys - a[1]) - (b[1] - a[1]) * (xs - a[0])
+
+    e0 = edge(point1, point2)
+    e1 = edge(point2, point3)
+    e2 = edge(point3, point1)
+
+    # A pixel is inside when it is on the same side of all three edges
+    # (which side depends on whether the corners go clockwise or not).
+    mask = ((e0 >= 0) & (e1 >= 0) & (e2 >= 0)) | ((e0 <= 0) & (e1 <= 0) & (e2 <= 0))
+    buf[y0:y1, x0:x1][mask] = value
+
+
+@functools.lru_cache(maxsize=32)
+def sierpinski_leaf_triangles(point1, point2, point3, level):
+    """
+    Computes every smallest triangle of the Sierpinski Triangle at once.
+
+    Each step of the recursion replaces a triangle by three half-size copies,
+    one shrunk towards each corner of the big triangle: p -> (p + corner) / 2.
+    Instead of recursing, we apply those three "shrink towards a corner" maps to
+    the whole NumPy array of triangles at every level, tripling it each time.
+
+    The image is a grid of whole pixels, so we stay on integer coordinates and
+    halve with a bit shift (>> 1) instead of a floating-point division.
+
+    The result only depends on the corners and the level, so it is memoized:
+    drawing the same triangle again reuses every midpoint computed before.
+    (draw_sierpinski_triangle only needs it when no C compiler is available.)
+
+    Args:
+        point1, point2, point3: (x, y) tuples with the big triangle's corners,
+                                in pixels (rounded to whole pixels if needed).
+        level: How many times to subdivide.
+
+    Returns:
+        A read-only (3**level, 3, 2) int64 NumPy array: one row of three
+        corners per triangle.
+    """
+    corners = np.rint(np.array([point1, point2, point3])).astype(np.int64)
+
+    # Start with just the big triangle.
+    triangles = corners[np.newaxis]
+    for _ in range(level):
+        # Three half-size copies of all current triangles, one per corner.
+        triangles = np.concatenate([(triangles + corner) >> 1 for corner in corners])
+
+    # The same array is handed out on every cache hit, so protect it from edits.
+    triangles.flags.writeable = False
+    return triangles
+
+
+def draw_sierpinski_triangle(buf, point1, point2, point3, level):
+    """
+    Draws the Sierpinski Triangle by filling all of its smallest triangles.
+
+    Args:
+        buf: A (height, width) uint8 NumPy buffer of palette indices to draw on.
         point1, point2, point3: Tuples representing the (x, y) coordinates of the
-                                 three vertices of the current triangle.
-        level: The current recursion depth. This determines how many
-               sub-triangles will be drawn.
-    """
-    # Base Case: If the recursion level reaches 0, we stop drawing.
-    # This prevents infinite recursion and defines the smallest triangles.
-    if level <= 0:
-        # Draw a filled triangle at the current level.
-        # The color is a shade of blue, making the fractal visually appealing.
-        # The color value increases with recursion depth for a subtle gradient effect.
-        color = (50 + (level % 5) * 10, 50 + (level % 5) * 10, 255 - (level % 5) * 10)
-        draw.polygon([point1, point2, point3], fill=color)
-        return # Exit the function for this branch of recursion
-
-    # Recursive Step: If level > 0, we need to draw smaller triangles.
-    # The Sierpinski Triangle is formed by connecting the midpoints of the
-    # sides of the larger triangle. This creates three new, smaller triangles.
-
-    # Calculate the midpoints of each side.
-    # Midpoint formula: ((x1 + x2) / 2, (y1 + y2) / 2)
-    mid12 = ((point1[0] + point2[0]) / 2, (point1[1] + point2[1]) / 2)
-    mid23 = ((point2[0] + point3[0]) / 2, (point2[1] + point3[1]) / 2)
-    mid31 = ((point3[0] + point1[0]) / 2, (point3[1] + point1[1]) / 2)
-
-    # Recursively call the function for each of the three new triangles.
-    # We decrease the 'level' by 1 for each recursive call. This ensures
-    # that each subsequent triangle is smaller and the recursion eventually ends.
-
-    # Draw the top-left smaller triangle.
-    draw_sierpinski_triangle(draw, point1, mid12, mid31, level - 1)
-
-    # Draw the bottom-left smaller triangle.
-    draw_sierpinski_triangle(draw, mid12, point2, mid23, level - 1)
-
-    # Draw the top-right smaller triangle.
-    draw_sierpinski_triangle(draw, mid31, mid23, point3, level - 1)
-
-    # Note: The central inverted triangle is intentionally left empty.
-    # This is the defining characteristic of the Sierpinski Triangle.
+                                 three vertices of the big triangle.
+        level: The recursion depth. This determines how many
+               sub-triangles will be drawn (3**level of them).
+    """
+    # The color is a shade of blue, making the fractal visually appealing.
+    # The smallest triangles sit at level 0 (or at `level` if it is negative).
+    color_index = level_color_index(min(level, 0))
+
+    # If a C compiler is available, let the renderer compiled for this level
+    # fill the buffer. This is the usual path.
+    height, width = buf.shape[:2]
+    if buf.dtype == np.uint8 and buf.ndim == 2 and buf.flags.c_contiguous:
+        render = _load_c_sierpinski_renderer(max(level, 0))
+        if render is not None:
+            corners = [int(round(c)) for p in (point1, point2, point3) for c in p]
+            render(buf.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)), color_index,
+                   width, height, *corners)
+            return
+
+    # Without a C compiler (or for other kinds of buffers), fall back to NumPy.
+    # The smallest triangles are where the recursion would stop (level 0).
+    # The central inverted triangles are never generated, which is the
+    # defining characteristic of the Sierpinski Triangle.
+    leaves = sierpinski_leaf_triangles(tuple(point1), tuple(point2), tuple(point3), max(level, 0))
+
+    # One rasterization pass over all the leaves.
+    for p1, p2, p3 in leaves:
+        fill_triangle(buf, p1, p2, p3, color_index)
+
+# --- Chaos Game Point Generation ---
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _chaos_game_kernel(vertices, choices, points, num_chunks):
+    """
+    The tight midpoint loop of the chaos game, compiled by Numba when available.
+
+    The points are split into `num_chunks` independent walks. Each walk fills
+    its own slice of `points`, so the walks can run in parallel without locks.
+
+    Args:
+        vertices: A (3, 2) float64 array with the corners of the triangle.
+        choices: A 1D array of corner indices (0, 1 or 2), one per point.
+        points: A preallocated (len(choices), 2) float64 array to fill.
+        num_chunks (int): How many independent walks to split the work into.
+    """
+    n = choices.shape[0]
+    for t in prange(num_chunks):
+        start = t * n // num_chunks
+        end = (t + 1) * n // num_chunks
+        # Start each walk on a corner: the corners are part of the fractal, so
+        # every point from the very first jump onwards lands on the triangle
+        # (no burn-in needed).
+        x = vertices[t % 3, 0]
+        y = vertices[t % 3, 1]
+        for i in range(start, end):
+            k = choices[i]
+            # Jump halfway towards the chosen corner (midpoint formula).
+            x = (x + vertices[k, 0]) * 0.5
+            y = (y + vertices[k, 1]) * 0.5
+            points[i, 0] = x
+            points[i, 1] = y
+
+
+@njit(parallel=True, cache=True)
+def _rasterize_points_kernel(points, buf, value):
+    """
+    Paints every point into the (height, width) palette-index buffer in parallel.
+
+    Two threads may hit the same pixel, but they always write the same value,
+    so no locking is needed. Points outside the image are skipped: compiled
+    code doesn't check indices, so writing there would corrupt memory.
+    """
+    height, width = buf.shape
+    for p in prange(points.shape[0]):
+        x = points[p, 0]
+        y = points[p, 1]
+        if x < 0 or x >= width or y < 0 or y >= height:
+            continue
+        buf[int(y), int(x)] = value
+
+
+# --- Compiling C Code at Runtime ---
+
+def _c_build_dir():
+    """
+    Returns this user's private directory for compiled C libraries.
+
+    Libraries are loaded straight into this process, so they must not live
+    somewhere other users can write to (like the shared temp directory):
+    anyone who could swap the file would get to run their code in our program.
+
+    Returns:
+        str: The directory path, or None if it can't be created or isn't
+        private to this user.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    build_dir = os.path.join(cache_home, "daily-codes-sierpinski")
+    try:
+        # mode=0o700: only we can read, write or list the directory.
+        os.makedirs(build_dir, mode=0o700, exist_ok=True)
+        info = os.stat(build_dir)
+    except OSError:
+        return None
+
+    # Only use a directory we own and nobody else can write to.
+    if info.st_uid != os.getuid() or info.st_mode & 0o022:
+        return None
+    return build_dir
+
+
+def _is_own_file(path):
+    """
+    Tells whether a file exists, belongs to us and only we can change it.
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    return info.st_uid == os.getuid() and not info.st_mode & 0o022
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_c_library(source, name):
+    """
+    Compiles C source code into a shared library and loads it with ctypes.
+
+    Args:
+        source (str): The C source code.
+        name (str): A short name used for the files in the build directory.
+
+    Returns:
+        The loaded ctypes.CDLL, or None if no C compiler is available
+        or compilation fails.
+    """
+    compiler = shutil.which("gcc") or shutil.which("cc")
+    build_dir = _c_build_dir()
+    if compiler is None or build_dir is None:
+        return None
+
+    # Name the library after a hash of the source so edits trigger a rebuild,
+    # while repeated runs reuse the library that is already on disk.
+    digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+    lib_path = os.path.join(build_dir, f"{name}_{digest}.so")
+
+    if not _is_own_file(lib_path):
+        # Compile under a unique temporary name and only then move the library
+        # into place: os.replace is atomic, so a program running at the same
+        # time never loads a half-written file.
+        fd, src_path = tempfile.mkstemp(prefix=f"{name}_", suffix=".c", dir=build_dir)
+        tmp_lib_path = src_path[:-2] + ".so"
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(source)
+            subprocess.run(
+                [compiler, "-O3", "-march=native", "-ffast-math", "-shared", "-fPIC",
+                 src_path, "-o", tmp_lib_path],
+                check=True, capture_output=True,
+            )
+            os.replace(tmp_lib_path, lib_path)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        finally:
+            for path in (src_path, tmp_lib_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    try:
+        return ctypes.CDLL(lib_path)
+    except OSError:
+        return None
+
+# --- C Fallback for the Chaos Game ---
+
+# The same midpoint loop written in C. It is compiled into a shared library the
+# first time it is needed and then called through ctypes.
+_C_CHAOS_SOURCE = """
+void chaos(const double *V, const unsigned char *choices, double *out, long n)
+{
+    double x = V[0], y = V[1];
+    for (long i = 0; i < n; i++) {
+        const double *corner = V + 2 * choices[i];
+        x = (x + corner[0]) * 0.5;
+        y = (y + corner[1]) * 0.5;
+        out[2 * i] = x;
+        out[2 * i + 1] = y;
+    }
+}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _load_c_chaos_kernel():
+    """
+    Compiles (once) and loads the C version of the chaos-game loop.
+
+    Returns:
+        The ctypes function `chaos`, or None if no C compiler is available
+        or compilation fails.
+    """
+    lib = _compile_c_library(_C_CHAOS_SOURCE, "sierpinski_chaos")
+    if lib is None:
+        return None
+
+    lib.chaos.argtypes = [
+        ctypes.POINTER(ctypes.c_double),
+        ctypes.POINTER(ctypes.c_ubyte),
+        ctypes.POINTER(ctypes.c_double),
+        ctypes.c_long,
+    ]
+    lib.chaos.restype = None
+    return lib.chaos
+
+# --- Compiled C Renderer for the Smallest Triangles ---
+
+# C code for filling every smallest triangle straight into the pixel buffer.
+# The recursion level is written into the source as a constant (LEVEL) before
+# compiling, so the C compiler can unroll the subdivision loop for it. The image
+# size and the corners are passed in as arguments, so there is one library per
+# level (only a handful ever get built), not one per picture.
+_C_RENDER_SOURCE = """
+static long long edge(long long ax, long long ay, long long bx, long long by,
+                      long long px, long long py)
+{
+    return (bx - ax) * (py - ay) - (by - ay) * (px - ax);
+}
+
+void render(unsigned char *buf, unsigned char value, long long width,
+            long long height, long long X1, long long Y1, long long X2,
+            long long Y2, long long X3, long long Y3)
+{
+    long long leaves = 1;
+    for (int j = 0; j < LEVEL; j++)
+        leaves *= 3;
+
+    for (long long t = 0; t < leaves; t++) {
+        /* Shrink the big triangle towards one corner per base-3 digit of t. */
+        long long ax = X1, ay = Y1, bx = X2, by = Y2, cx = X3, cy = Y3;
+        long long digits = t;
+        for (int j = 0; j < LEVEL; j++) {
+            int k = digits % 3;
+            digits /= 3;
+            long long kx = k == 0 ? X1 : (k == 1 ? X2 : X3);
+            long long ky = k == 0 ? Y1 : (k == 1 ? Y2 : Y3);
+            ax = (ax + kx) >> 1; ay = (ay + ky) >> 1;
+            bx = (bx + kx) >> 1; by = (by + ky) >> 1;
+            cx = (cx + kx) >> 1; cy = (cy + ky) >> 1;
+        }
+
+        /* Integer bounding box of the triangle, clipped to the image. */
+        long long x0 = ax < bx ? (ax < cx ? ax : cx) : (bx < cx ? bx : cx);
+        long long x1 = ax > bx ? (ax > cx ? ax : cx) : (bx > cx ? bx : cx);
+        long long y0 = ay < by ? (ay < cy ? ay : cy) : (by < cy ? by : cy);
+        long long y1 = ay > by ? (ay > cy ? ay : cy) : (by > cy ? by : cy);
+        if (x0 < 0) x0 = 0;
+        if (y0 < 0) y0 = 0;
+        if (x1 > width - 1) x1 = width - 1;
+        if (y1 > height - 1) y1 = height - 1;
+
+        /* Edge-function test, the same one fill_triangle uses. */
+        for (long long y = y0; y <= y1; y++) {
+            for (long long x = x0; x <= x1; x++) {
+                long long e0 = edge(ax, ay, bx, by, x, y);
+                long long e1 = edge(bx, by, cx, cy, x, y);
+                long long e2 = edge(cx, cy, ax, ay, x, y);
+                if ((e0 >= 0 && e1 >= 0 && e2 >= 0) || (e0 <= 0 && e1 <= 0 && e2 <= 0)) {
+                    buf[y * width + x] = value;
+                }
+            }
+        }
+    }
+}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _load_c_sierpinski_renderer(level):
+    """
+    Compiles (once per level) and loads the C renderer for the smallest triangles.
+
+    Args:
+        level (int): The recursion depth the renderer is specialized for.
+
+    Returns:
+        The ctypes function
+        `render(buf, value, width, height, x1, y1, x2, y2, x3, y3)`,
+        or None if no C compiler is available or compilation fails.
+    """
+    source = f"#define LEVEL {level}\n" + _C_RENDER_SOURCE
+    lib = _compile_c_library(source, f"sierpinski_render_level{level}")
+    if lib is None:
+        return None
+
+    lib.render.argtypes = [
+        ctypes.POINTER(ctypes.c_ubyte), ctypes.c_ubyte,
+        ctypes.c_longlong, ctypes.c_longlong,
+    ] + [ctypes.c_longlong] * 6
+    lib.render.restype = None
+    return lib.render
+
+
+def generate_chaos_game_points(vertices, num_points):
+    """
+    Generates points on the Sierpinski Triangle using the "chaos game".
+
+    Starting from a corner, we repeatedly pick one of the three corners at
+    random and jump halfway towards it. Every point we land on belongs to the
+    Sierpinski Triangle, so plotting enough of them reveals the fractal without
+    any recursion at all.
+
+    Args:
+        vertices: A (3, 2) NumPy array with the (x, y) coordinates of the corners.
+        num_points (int): How many points to generate.
+
+    Returns:
+        A (num_points, 2) float64 NumPy array of (x, y) points.
+    """
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+
+    # Pick all the random corners up front in a single NumPy call.
+    choices = np.random.randint(0, 3, num_points, dtype=np.uint8)
+
+    # Preallocate the output array so we never grow a Python list.
+    points = np.empty((num_points, 2), dtype=np.float64)
+
+    c_chaos = None if HAVE_NUMBA else _load_c_chaos_kernel()
+    if c_chaos is not None:
+        c_chaos(
+            vertices.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            choices.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+            points.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            num_points,
+        )
+    else:
+        _chaos_game_kernel(vertices, choices, points, max(1, min(CHAOS_CHUNKS, num_points)))
+    return points
+
+
+if HAVE_NUMBA:
+    # Warm-up call: Numba compiles on first use, so pay that cost once at
+    # import time instead of inside the first real render.
+    _chaos_game_kernel(np.zeros((3, 2)), np.zeros(1, dtype=np.uint8), np.empty((1, 2)), 1)
+    _rasterize_points_kernel(np.zeros((1, 2)), np.empty((1, 1), dtype=np.uint8), np.uint8(0))
+
+# --- GPU Chaos Game ---
+
+if HAVE_CUDA:
+    @cuda.jit
+    def _chaos_game_cuda_kernel(vertices, rng_states, points_per_walk, buf, value):
+        """
+        One GPU thread per walk: each thread jumps around the triangle with its
+        own random number generator and paints every point straight into the image.
+        Two threads may hit the same pixel, but they always write the same value.
+        Points outside the image are skipped, since the GPU doesn't check indices.
+        """
+        walk = cuda.grid(1)
+        if walk >= rng_states.shape[0]:
+            return
+        height, width = buf.shape
+
+        # Start on a corner, which is already part of the fractal.
+        x = vertices[walk % 3, 0]
+        y = vertices[walk % 3, 1]
+        for _ in range(points_per_walk):
+            k = min(int(xoroshiro128p_uniform_float32(rng_states, walk) * 3), 2)
+            x = (x + vertices[k, 0]) * 0.5
+            y = (y + vertices[k, 1]) * 0.5
+            if 0 <= x < width and 0 <= y < height:
+                buf[int(y), int(x)] = value
+
+
+def render_chaos_game_gpu(buf, vertices, num_points, value):
+    """
+    Plays the chaos game on the GPU and paints the points into `buf`.
+
+    The image is copied to the graphics card once, thousands of walks fill it
+    in parallel there, and the result is copied back once at the end.
+
+    Args:
+        buf: A (height, width) uint8 NumPy buffer of palette indices to draw on.
+        vertices: A (3, 2) NumPy array with the (x, y) coordinates of the corners.
+        num_points (int): How many points to plot in total.
+        value: The palette index of the points.
+    """
+    num_walks = max(1, min(GPU_WALKS, num_points))
+    points_per_walk = -(-num_points // num_walks)  # Round up.
+    blocks = -(-num_walks // GPU_THREADS_PER_BLOCK)
+
+    rng_states = create_xoroshiro128p_states(num_walks, seed=np.random.randint(2 ** 31))
+    d_vertices = cuda.to_device(np.ascontiguousarray(vertices, dtype=np.float64))
+    d_buf = cuda.to_device(buf)
+
+    _chaos_game_cuda_kernel[blocks, GPU_THREADS_PER_BLOCK](d_vertices, rng_states, points_per_walk, d_buf, np.uint8(value))
+    d_buf.copy_to_host(buf)
 
 # --- Image Creation and Saving ---
 
-def create_fractal_image(width, height, max_level):
+def create_fractal_image(width, height, max_level, method="chaos"):
     """
     Creates an image and draws the Sierpinski Triangle on it.
 
@@ -68,13 +588,11 @@ def create_fractal_image(width, height, max_level):
         width (int): The width of the image in pixels.
         height (int): The height of the image in pixels.
         max_level (int): The maximum recursion depth for the Sierpinski Triangle.
+                         For the chaos game it sets how much detail is plotted.
+        method (str): "chaos" plots points from the chaos game (fast),
+                      "recursive" fills every smallest triangle of the
+                      recursive construction.
     """
-    # Create a new blank image with a white background.
-    # 'RGB' mode means Red, Green, Blue color channels.
-    img = Image.new('RGB', (width, height), color='white')
-    # Create a drawing object that can be used to draw shapes on the image.
-    draw = ImageDraw.Draw(img)
-
     # Define the initial vertices of the main triangle.
     # These are placed in the center of the image for good composition.
     # The bottom vertices are spaced out, and the top vertex is centered above.
@@ -82,10 +600,43 @@ def create_fractal_image(width, height, max_level):
     padding = 50
     initial_point1 = (padding, height - padding)  # Bottom-left
     initial_point2 = (width - padding, height - padding) # Bottom-right
-    initial_point3 = (width / 2, padding)           # Top-center
+    initial_point3 = (width // 2, padding)          # Top-center
+
+    # Both methods paint palette indices into the same one-byte-per-pixel buffer,
+    # starting from the background (index 0). It is turned into an RGB PIL image
+    # with a single palette lookup at the end.
+    buf = np.zeros((height, width), dtype=np.uint8)
 
-    # Start the recursive drawing process.
-    draw_sierpinski_triangle(draw, initial_point1, initial_point2, initial_point3, max_level)
+    if method == "chaos":
+        # Enough points to fill every smallest triangle of the requested level.
+        num_points = POINTS_PER_LEAF * 3 ** max_level
+        vertices = np.array([initial_point1, initial_point2, initial_point3], dtype=np.float64)
+
+        if HAVE_CUDA and num_points >= GPU_MIN_POINTS:
+            # Big jobs: generate and paint the points on the GPU.
+            render_chaos_game_gpu(buf, vertices, num_points, CHAOS_COLOR_INDEX)
+        else:
+            points = generate_chaos_game_points(vertices, num_points)
+
+            if HAVE_NUMBA:
+                _rasterize_points_kernel(points, buf, np.uint8(CHAOS_COLOR_INDEX))
+            else:
+                # Keep only the points that land inside the image (in small
+                # images the padded corners can lie outside it), then convert
+                # them to integer pixel coordinates and paint them all at once.
+                inside = ((points[:, 0] >= 0) & (points[:, 0] < width) &
+                          (points[:, 1] >= 0) & (points[:, 1] < height))
+                xs, ys = points[inside].astype(np.int32).T
+                buf[ys, xs] = CHAOS_COLOR_INDEX
+    elif method == "recursive":
+        # Fill every smallest triangle of the recursive construction.
+        draw_sierpinski_triangle(buf, initial_point1, initial_point2, initial_point3, max_level)
+    else:
+        raise ValueError(f"Unknown method: {method!r} (expected 'chaos' or 'recursive')")
+
+    # Look up the real color of every pixel in the palette.
+    # 'RGB' mode means Red, Green, Blue color channels.
+    img = Image.fromarray(PALETTE[buf], 'RGB')
 
     # Save the generated fractal image.
     # The filename includes the max_level to distinguish different creations.
@@ -8,8 +8,9 @@
 # visually interesting outputs.
 
 # Import necessary libraries
-from PIL import Image, ImageDraw
-import random
+from PIL import Image
+import numpy as np
+from functools import lru_cache
 
 # --- Configuration and Setup ---
 
@@ -36,63 +37,76 @@ MAX_SHAPE_SIZE = 50
 MIN_ALPHA = 100
 MAX_ALPHA = 220
 
+# A single NumPy random number generator shared by the whole script.
+rng = np.random.default_rng()
+
 # --- Core Logic: Data to Visual Mapping ---
 
-def generate_random_color():
+def random_ints(low, high, shape):
     """
-    Generates a random RGB color tuple.
-    Each component (R, G, B) is an integer between 0 and 255.
-    This function provides the "color" aspect of our art.
+    Draws a whole array of random whole numbers between low and high
+    (both included), every value equally likely.
+    Drawing them in a single call is much cheaper than asking for
+    every random number separately.
+
+    Returns:
+        numpy.ndarray: An array of the given shape with int16 values.
     """
-    r = random.randint(0, 255)
-    g = random.randint(0, 255)
-    b = random.randint(0, 255)
-    return (r, g, b)
+    return rng.integers(low, high + 1, shape, dtype=np.int16)
 
-def map_data_to_visuals(element_index, total_elements):
+def map_data_to_visuals(total_elements):
     """
-    This is the core of our art generation. It takes a conceptual "data point"
+    This is the core of our art generation. It takes every conceptual "data point"
     (represented here by its index) and maps it to visual properties.
 
-    In a real application, 'element_index' would be a value from your actual dataset.
-    Here, we use it to introduce some randomness and variation, simulating data.
+    In a real application, the indices would be values from your actual dataset.
+    Here, we use them to introduce some randomness and variation, simulating data.
+
+    Instead of handling one element at a time, we compute each property for all
+    elements at once with NumPy arrays. That replaces thousands of small Python
+    calls with a handful of fast, vectorized ones.
 
     Args:
-        element_index (int): The index of the current element being processed.
-                             Simulates a data point identifier.
         total_elements (int): The total number of elements. Used for scaling.
 
     Returns:
-        tuple: A dictionary containing visual properties:
-               'x', 'y': The center coordinates of the shape.
-               'size': The diameter of the shape.
-               'color': The RGB color tuple of the shape.
-               'alpha': The transparency of the shape.
+        dict: A dictionary of NumPy arrays (one entry per element) with visual properties:
+              'x', 'y': The center coordinates of the shapes.
+              'size': The diameters of the shapes.
+              'color': The (total_elements, 3) RGB colors of the shapes.
+              'alpha': The transparency of the shapes.
     """
+    # The "data points": one index per element.
+    element_index = np.arange(total_elements)
+
+    # The random x/y jitter (-20 to 20) for every element, drawn at once.
+    jitter = random_ints(-20, 20, (total_elements, 2))
+
     # Map element_index to x-coordinate (horizontal position)
     # We want shapes distributed across the width of the canvas.
     # Using 'element_index' with a range of 0 to 'total_elements' allows
     # us to spread things out. The modulo operator (%) ensures we don't
-    # exceed the canvas width, and we add some randomness.
-    x = (element_index * (CANVAS_WIDTH // total_elements) + random.randint(-20, 20)) % CANVAS_WIDTH
+    # exceed the canvas width, and we add some randomness (-20 to 20).
+    x = (element_index * (CANVAS_WIDTH // total_elements) + jitter[:, 0]) % CANVAS_WIDTH
 
     # Map element_index to y-coordinate (vertical position)
     # Similar logic to x-coordinate, but for the height.
-    y = (element_index * (CANVAS_HEIGHT // total_elements) + random.randint(-20, 20)) % CANVAS_HEIGHT
+    y = (element_index * (CANVAS_HEIGHT // total_elements) + jitter[:, 1]) % CANVAS_HEIGHT
 
     # Map element_index to size
     # We use a range and add randomness to vary shape sizes.
     # Here, we are not directly mapping a data value to size, but simulating
     # variation. In a real case, a larger data value might mean a larger size.
-    size = random.randint(MIN_SHAPE_SIZE, MAX_SHAPE_SIZE)
+    size = random_ints(MIN_SHAPE_SIZE, MAX_SHAPE_SIZE, total_elements)
 
-    # Generate a random color for each element.
+    # Use three random bytes as the color of each element.
+    # Each component (R, G, B) is an integer between 0 and 255.
     # This is a simple approach; we could also map data values to specific colors.
-    color = generate_random_color()
+    color = rng.integers(0, 256, (total_elements, 3), dtype=np.uint8)
 
     # Map element_index to alpha (transparency)
     # This adds depth and layering to our artwork.
-    alpha = random.randint(MIN_ALPHA, MAX_ALPHA)
+    alpha = random_ints(MIN_ALPHA, MAX_ALPHA, total_elements)
 
     return {
         'x': x,
@@ -102,6 +116,64 @@ def map_data_to_visuals(element_index, total_elements):
         'alpha': alpha
     }
 
+# --- Drawing Helpers ---
+
+@lru_cache(maxsize=None)
+def circle_mask(radius):
+    """
+    Returns a square float32 array that is 1.0 inside a circle and 0.0 outside.
+
+    The mask only depends on the radius, so each size is computed once and
+    then reused for every shape of that size (a small lookup table).
+
+    Args:
+        radius (int): The radius of the circle in pixels.
+
+    Returns:
+        numpy.ndarray: A (2*radius+1, 2*radius+1, 1) array. The extra axis
+                       lets it scale all three color channels at once.
+    """
+    offsets = np.arange(-radius, radius + 1)
+    # Measuring to the pixel edge (radius + 0.5) gives the same outline PIL draws.
+    inside = offsets[:, np.newaxis] ** 2 + offsets[np.newaxis, :] ** 2 <= (radius + 0.5) ** 2
+    return inside.astype(np.float32)[:, :, np.newaxis]
+
+def blend_circle(canvas, x, y, size, color, alpha):
+    """
+    Alpha-blends a filled circle straight into a NumPy canvas.
+
+    Each pixel inside the circle becomes a mix of the shape color and whatever
+    is already there: new = opacity * color + (1 - opacity) * old.
+
+    Args:
+        canvas: A (height, width, 3) float32 array holding the image pixels.
+        x, y (int): The center of the circle.
+        size (int): The diameter of the circle.
+        color: The (r, g, b) color of the circle.
+        alpha (int): The transparency of the circle (0 to 255).
+    """
+    height, width = canvas.shape[:2]
+    radius = size // 2
+
+    # Bounding box of the circle, clipped to the canvas.
+    x0, y0 = x - radius, y - radius
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x + radius + 1, width), min(y + radius + 1, height)
+    if cx0 >= cx1 or cy0 >= cy1:
+        return
+
+    # The part of the mask that lands on the canvas.
+    mask = circle_mask(radius)[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]
+    region = canvas[cy0:cy1, cx0:cx1]
+
+    # Do the whole blend with a single scratch array: compute (color - old),
+    # scale it by the mask and opacity in place, then add it in place.
+    # This walks the shape's pixels a few times without allocating new arrays.
+    tint = np.subtract(np.asarray(color, dtype=np.float32), region)
+    tint *= mask
+    tint *= alpha / 255
+    region += tint
+
 # --- Art Generation Function ---
 
 def generate_abstract_art(num_elements, output_filename="abstract_art.png"):
@@ -112,40 +184,32 @@ def generate_abstract_art(num_elements, output_filename="abstract_art.png"):
         num_elements (int): The number of elements (shapes) to draw.
         output_filename (str): The name of the file to save the art to.
     """
-    # Create a new blank image with the specified dimensions and background color.
-    # 'RGB' mode is for color images.
-    image = Image.new('RGB', (CANVAS_WIDTH, CANVAS_HEIGHT), BACKGROUND_COLOR)
-
-    # Get a drawing context. This object allows us to draw shapes, lines, and text.
-    draw = ImageDraw.Draw(image, 'RGBA') # 'RGBA' allows for transparency
-
-    # Loop through each conceptual "data point" (represented by an index)
-    for i in range(num_elements):
-        # Get the visual properties mapped from our simulated data
-        visual_props = map_data_to_visuals(i, num_elements)
-
-        # Extract the properties for easier access
-        x = visual_props['x']
-        y = visual_props['y']
-        size = visual_props['size']
-        color = visual_props['color']
-        alpha = visual_props['alpha']
-
-        # Calculate the bounding box for the ellipse (circle)
-        # The 'ellipse' function takes the coordinates of a rectangle
-        # defining its boundaries.
-        # (x0, y0) is the top-left corner, (x1, y1) is the bottom-right.
-        x0 = x - size // 2
-        y0 = y - size // 2
-        x1 = x + size // 2
-        y1 = y + size // 2
-        bounding_box = (x0, y0, x1, y1)
-
-        # Draw an ellipse (which appears as a circle if the bounding box is square)
-        # We combine the color and alpha into a RGBA tuple for transparency.
-        # alpha is a value from 0 to 255, so we need to combine it with the RGB.
-        # PIL handles this combination when drawing with RGBA mode.
-        draw.ellipse(bounding_box, fill=(color[0], color[1], color[2], alpha))
+    # Create a blank canvas filled with the background color.
+    # We paint into a NumPy array of (red, green, blue) values instead of asking
+    # PIL to draw each shape. Floats keep the blending exact until the very end.
+    canvas = np.empty((CANVAS_HEIGHT, CANVAS_WIDTH, 3), dtype=np.float32)
+    canvas[:] = BACKGROUND_COLOR
+
+    # Get the visual properties of every element, mapped from our simulated data
+    visual_props = map_data_to_visuals(num_elements)
+
+    # Convert the arrays to plain Python lists once, so the drawing loop
+    # below works with ordinary ints instead of NumPy scalars.
+    xs = visual_props['x'].tolist()
+    ys = visual_props['y'].tolist()
+    sizes = visual_props['size'].tolist()
+    colors = visual_props['color'].tolist()
+    alphas = visual_props['alpha'].tolist()
+
+    # Loop through each conceptual "data point" and draw it
+    for x, y, size, color, alpha in zip(xs, ys, sizes, colors, alphas):
+        # Blend a circle of the element's color into the canvas.
+        # alpha is a value from 0 to 255 that controls how much of the
+        # existing picture still shows through the shape.
+        blend_circle(canvas, x, y, size, color, alpha)
+
+    # Convert the finished canvas to an 8-bit 'RGB' image (a single PIL call)
+    image = Image.fromarray(np.rint(canvas).astype(np.uint8), 'RGB')
 
     # Save the generated image to a file
     image.save(output_filename)
@@ -7,9 +7,13 @@
 import tkinter as tk
 # We'll use the ttk module for themed widgets, which generally look better.
 from tkinter import ttk
-# For this example, we'll use a simple list to store spending data.
+# For this example, we'll use a simple array to store spending data.
 # In a real application, you'd likely use a database or file.
-from collections import defaultdict # defaultdict simplifies counting items
+# array('d') stores plain decimal numbers packed together in memory,
+# which is more compact than a dictionary full of Python number objects.
+from array import array
+# bisect keeps a list sorted as we insert into it, so we never need to re-sort.
+import bisect
 
 # Define a function to create and manage our spending visualization application.
 def create_spending_visualizer():
@@ -22,10 +26,13 @@ def create_spending_visualizer():
 
     # --- Data Storage ---
 
-    # A dictionary to store spending by category.
-    # defaultdict(int) automatically initializes a new key with a value of 0 if it doesn't exist.
-    # This avoids needing to check if a category is already in the dictionary.
-    spending_data = defaultdict(int)
+    # The total spending of each category lives in a packed array of numbers,
+    # and a dictionary remembers at which position each category's total is stored.
+    category_index = {}
+    category_totals = array('d')
+    # The category names, kept in alphabetical order as they are added.
+    # Inserting a new name is cheap, so the summary never has to sort them again.
+    sorted_categories = []
 
     # --- GUI Elements (Widgets) ---
 
@@ -84,14 +91,40 @@ def create_spending_visualizer():
             update_summary("Error: Invalid expense amount. Please enter a number.")
             return
 
+        # A new category gets the next free slot in the totals array,
+        # and is remembered in its alphabetical position.
+        index = category_index.get(category)
+        if index is None:
+            index = category_index[category] = len(category_totals)
+            category_totals.append(0.0)
+            bisect.insort(sorted_categories, category)
+
         # Add the valid expense amount to the corresponding category in our data.
-        spending_data[category] += expense_amount
+        category_totals[index] += expense_amount
 
         # Clear the entry fields after successful addition.
         expense_entry.delete(0, tk.END) # Delete from the beginning (0) to the end (tk.END)
         category_entry.delete(0, tk.END)
 
         # Refresh the summary display to show the updated spending.
+        schedule_summary_refresh()
+
+    # True while a summary refresh is waiting to run.
+    refresh_pending = False
+
+    # This function asks Tk to refresh the summary once it has nothing else to do.
+    # If many expenses are added in a row (for example by a script importing a file),
+    # they all share a single refresh instead of redrawing the summary every time.
+    def schedule_summary_refresh():
+        nonlocal refresh_pending
+        if not refresh_pending:
+            refresh_pending = True
+            root.after_idle(run_summary_refresh)
+
+    # This function performs the refresh that was scheduled above.
+    def run_summary_refresh():
+        nonlocal refresh_pending
+        refresh_pending = False
         update_summary()
 
     # This function updates the spending summary display.
@@ -105,16 +138,20 @@ def create_spending_visualizer():
             summary_text.insert(tk.END, error_message)
         else:
             # If there's no error, iterate through the spending data.
+            # We build the whole summary as a list of lines first, because every
+            # insert() call is a round-trip to Tk, and one big insert is much cheaper.
+            lines = []
             total_spending = 0
-            # Sort categories alphabetically for a consistent display.
-            for category in sorted(spending_data.keys()):
-                amount = spending_data[category]
+            # Categories are already in alphabetical order for a consistent display.
+            for category in sorted_categories:
+                amount = category_totals[category_index[category]]
                 # Format the string to display category and amount.
-                summary_text.insert(tk.END, f"{category}: ${amount:.2f}\n") # :.2f formats to 2 decimal places
+                lines.append(f"{category}: ${amount:.2f}") # :.2f formats to 2 decimal places
                 total_spending += amount
             # Add a line for the total spending.
-            summary_text.insert(tk.END, "--------------------\n")
-            summary_text.insert(tk.END, f"Total: ${total_spending:.2f}\n")
+            lines.append("--------------------")
+            lines.append(f"Total: ${total_spending:.2f}")
+            summary_text.insert(tk.END, "\n".join(lines) + "\n")
 
         # Disable the Text widget again after updating.
         summary_text.config(state=tk.DISABLED)
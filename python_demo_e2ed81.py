@@ -1,108 +1,140 @@
-# Fractal Generation with Turtle Graphics - A Recursive Approach
+# Fractal Generation with Pillow - From Recursion to an L-system
 
 # Learning Objective:
 # This tutorial will teach you how to procedurally generate and visualize
-# intricate fractal art using Python's turtle graphics library. We will focus
+# intricate fractal art using Python and the Pillow imaging library. We will focus
 # on the concept of recursion to create self-similar patterns, a fundamental
-# principle in fractal generation. By the end of this tutorial, you will
-# understand how simple rules and recursive calls can lead to complex and
-# beautiful geometric designs.
-
-import turtle
-
-# --- Fractal Generation Function ---
-
-# This function recursively draws a fractal pattern.
-# Recursion is when a function calls itself. It's perfect for fractals
-# because fractal patterns are often defined in terms of smaller,
-# identical versions of themselves.
-def draw_fractal(artist, length, depth, angle):
+# principle in fractal generation, and on how an L-system (a text rewriting
+# rule) expresses the same recursion without recursive function calls. By the
+# end of this tutorial, you will understand how simple rules can lead to
+# complex and beautiful geometric designs.
+
+import math
+from collections import deque
+
+from PIL import Image, ImageDraw
+
+# --- Canvas Settings ---
+IMAGE_WIDTH = 800
+IMAGE_HEIGHT = 600
+BACKGROUND_COLOR = "black"
+LINE_COLOR = "cyan"
+
+# --- Fractal Generation Functions ---
+
+# The fractal is self-similar: every straight line is replaced by a smaller
+# copy of the whole pattern ("line, turn left, line, turn right twice, line,
+# turn left"). We can write that rule down as text, an "L-system":
+#   F = move forward and draw a line
+#   + = turn left by the angle
+#   - = turn right by the angle
+# Starting from a single "F" and replacing every "F" with the rule once per
+# level of depth gives the complete list of drawing instructions.
+#
+# Writing that whole list out first would need memory for every instruction
+# (it grows about three times longer with each level). Instead we produce the
+# instructions one at a time, using our own stack (a to-do list) in place of
+# recursive function calls: the stack only ever holds a few entries per level.
+FRACTAL_RULE = "F+F--F+"
+
+def iter_fractal_instructions(depth):
     """
-    Recursively draws a fractal pattern.
+    Produces the L-system's drawing instructions one at a time.
 
     Args:
-        artist: The turtle object used for drawing.
-        length: The current length of the line segment to draw.
-        depth: The current recursion depth. This controls how many times
-               the fractal pattern repeats.
-        angle: The angle to turn for creating branches.
-    """
-    # Base Case: The condition that stops the recursion.
-    # If the depth reaches 0, we stop drawing further. This prevents
-    # infinite recursion and defines the smallest element of our fractal.
-    if depth == 0:
-        artist.forward(length)
-        return  # Exit the function to stop recursion for this branch.
+        depth: How many times the pattern repeats inside itself.
 
-    # Recursive Step: The part where the function calls itself.
-    # We reduce the length and depth for the next level of recursion.
-    # This is how we create smaller, self-similar versions of the pattern.
+    Yields:
+        str: One instruction, "F", "+" or "-", e.g. F + F - - F + for depth 1.
+    """
+    # Each entry is (symbol, how many more times it may be expanded).
+    stack = deque([("F", depth)])
+    while stack:
+        symbol, levels_left = stack.pop()
+        if symbol == "F" and levels_left > 0:
+            # Replace this "F" with the rule. A stack hands back the last thing
+            # pushed first, so we push the rule backwards to keep its order.
+            for rule_symbol in reversed(FRACTAL_RULE):
+                stack.append((rule_symbol, levels_left - 1))
+        else:
+            yield symbol
+
+def draw_fractal(draw, pen, length, depth, angle):
+    """
+    Draws a fractal pattern by following its L-system instructions.
 
-    # Calculate the new length for the next level of recursion.
-    # We typically reduce the length to make the fractal smaller as we go deeper.
-    new_length = length / 2
+    Instead of a turtle, we keep track of the "pen" ourselves: where it is
+    and which way it points. The path never lifts the pen, so we collect every
+    point it passes through and draw the whole path with one ImageDraw call.
 
-    # Draw the first branch.
-    draw_fractal(artist, new_length, depth - 1, angle)
+    Args:
+        draw: The ImageDraw object used for drawing.
+        pen: A tuple (x, y, heading) with the pen's position in pixels and
+             its direction in degrees (0 = right, 90 = up).
+        length: The length of the whole pattern's first line.
+        depth: How many times the fractal pattern repeats.
+        angle: The angle to turn for creating branches.
 
-    # Turn left to prepare for the next branch.
-    # This angle is crucial for shaping the fractal.
-    artist.left(angle)
+    Returns:
+        tuple: The pen (x, y, heading) after drawing the fractal.
+    """
+    x, y, heading = pen
 
-    # Draw the second branch.
-    draw_fractal(artist, new_length, depth - 1, angle)
+    # Every level of depth halves the length of the lines.
+    step = length / 2 ** depth
 
-    # Turn right to return to the original orientation before drawing the previous branch.
-    # This allows us to draw subsequent branches from the correct position and angle.
-    artist.right(angle)
-    # We need to account for the 'left' turn made earlier.
-    artist.right(angle) # This is because we turned left and then right.
+    points = [(x, y)]
+    for instruction in iter_fractal_instructions(depth):
+        if instruction == "F":
+            # Move forward by `step` in the direction of `heading`.
+            # Image y coordinates grow downwards, so "up" means subtracting.
+            x += step * math.cos(math.radians(heading))
+            y -= step * math.sin(math.radians(heading))
+            points.append((x, y))
+        elif instruction == "+":
+            heading += angle
+        else:  # "-"
+            heading -= angle
 
-    # Draw the third branch.
-    draw_fractal(artist, new_length, depth - 1, angle)
+    # One call draws the whole connected path.
+    draw.line(points, fill=LINE_COLOR)
 
-    # Turn left to return to the original orientation after drawing the third branch.
-    artist.left(angle)
+    return (x, y, heading)
 
 
 # --- Setup and Execution ---
 
-# This is the main part of our script where we set up the turtle and
+# This is the main part of our script where we set up the canvas and
 # initiate the fractal drawing.
 
-def create_fractal_art(initial_length=100, recursion_depth=5, turn_angle=30):
+def create_fractal_art(initial_length=100, recursion_depth=5, turn_angle=30, filename="fractal_art.png"):
     """
-    Sets up the turtle screen and draws a fractal.
+    Sets up the canvas, draws a fractal and saves it as an image.
 
     Args:
         initial_length: The starting length of the main branch.
         recursion_depth: The maximum depth of recursion for the fractal.
         turn_angle: The angle used for branching.
+        filename: Where to save the finished picture (PNG).
+
+    Returns:
+        The finished PIL Image.
     """
-    # Create a screen object to control the drawing window.
-    screen = turtle.Screen()
-    screen.setup(width=800, height=600)  # Set the dimensions of the window.
-    screen.bgcolor("black")  # Set the background color to black.
-    screen.title("Recursive Fractal Art")  # Set the window title.
-
-    # Create a turtle object, which is our "artist".
-    artist = turtle.Turtle()
-    artist.speed(0)  # Set the drawing speed to the fastest possible.
-    artist.color("cyan")  # Set the color of the drawn lines.
-    artist.penup()  # Lift the pen so we don't draw while moving to the start.
-    artist.goto(0, -200)  # Move the turtle to the starting position at the bottom center.
-    artist.pendown()  # Put the pen down to start drawing.
-    artist.left(90)  # Point the turtle upwards initially.
-
-    # Call the recursive function to start drawing the fractal.
-    # We pass the turtle object, initial length, depth, and angle.
-    draw_fractal(artist, initial_length, recursion_depth, turn_angle)
-
-    # Hide the turtle cursor after drawing is complete for a cleaner look.
-    artist.hideturtle()
-
-    # Keep the window open until it's manually closed.
-    screen.mainloop()
+    # Create a black image to draw on, and a drawing object for it.
+    img = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(img)
+
+    # Start at the bottom center, pointing upwards.
+    # (200 pixels below the middle of the image.)
+    start_pen = (IMAGE_WIDTH / 2, IMAGE_HEIGHT / 2 + 200, 90)
+
+    # Draw the fractal.
+    # We pass the drawing object, starting pen, initial length, depth, and angle.
+    draw_fractal(draw, start_pen, initial_length, recursion_depth, turn_angle)
+
+    # Save the picture so it can be opened in any image viewer.
+    img.save(filename)
+    return img
 
 # --- Example Usage ---
 
@@ -122,4 +154,4 @@ if __name__ == "__main__":
     # Example 3: A fractal with a wider angle for more spread.
     # Uncomment the line below to try it out.
     # create_fractal_art(initial_length=120, recursion_depth=3, turn_angle=60)
-    print("Fractal generation complete. Window should be visible.")
\ No newline at end of file
+    print("Fractal generation complete. Saved to fractal_art.png")
\ No newline at end of file
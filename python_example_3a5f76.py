@@ -4,7 +4,7 @@
 # Import the Pillow library, which is a fork of the Python Imaging Library (PIL)
 # and is essential for image manipulation in Python.
 from PIL import Image, ImageDraw
-import random
+import numpy as np
 
 # --- Configuration ---
 # Define the dimensions of our canvas. This determines the width and height of the artwork.
@@ -17,34 +17,33 @@ NUM_SHAPES = 150
 # Define the maximum size for random shapes. This controls the scale of individual elements.
 MAX_SHAPE_SIZE = 100
 
+# One NumPy random number generator for the whole script.
+# Asking it for many random numbers at once (a whole array in one call) is much
+# faster than calling Python's random module once per number.
+rng = np.random.default_rng()
+
 # --- Helper Functions ---
+# Each helper generates the values for ALL the shapes at once, as a NumPy array.
+
+# This function generates random colors.
+# Each row is an RGB color (Red, Green, Blue) where each value is between 0 and 255.
+def generate_random_colors(count):
+    # rng.integers(low, high) returns random integers N such that low <= N < high.
+    # We generate red, green, and blue components for every shape in one go.
+    return rng.integers(0, 256, size=(count, 3), dtype=np.uint8)
 
-# This function generates a random color.
-# It returns an RGB tuple (Red, Green, Blue) where each value is between 0 and 255.
-def generate_random_color():
-    # random.randint(a, b) returns a random integer N such that a <= N <= b.
-    # We generate random values for red, green, and blue components.
-    r = random.randint(0, 255)
-    g = random.randint(0, 255)
-    b = random.randint(0, 255)
-    # The RGB tuple is returned. This format is understood by Pillow for colors.
-    return (r, g, b)
-
-# This function generates a random coordinate within the canvas dimensions.
+# This function generates random coordinates within the canvas dimensions.
 # It ensures that the generated x and y values are within the bounds of our image.
-def generate_random_position(max_width, max_height):
-    # Generate a random x-coordinate from 0 to max_width - 1.
-    x = random.randint(0, max_width - 1)
-    # Generate a random y-coordinate from 0 to max_height - 1.
-    y = random.randint(0, max_height - 1)
-    # Return the (x, y) coordinate tuple.
-    return (x, y)
-
-# This function generates a random size for a shape.
+def generate_random_positions(count, max_width, max_height):
+    # Column 0 gets x-coordinates from 0 to max_width - 1, column 1 gets
+    # y-coordinates from 0 to max_height - 1 (the bounds are used per column).
+    return rng.integers(0, [max_width, max_height], size=(count, 2))
+
+# This function generates random sizes for the shapes.
 # It ensures the size is not too small or too large, providing some variety.
-def generate_random_size(max_size):
-    # Generate a random size between 10 (to ensure visibility) and max_size.
-    return random.randint(10, max_size)
+def generate_random_sizes(count, max_size):
+    # Generate sizes between 10 (to ensure visibility) and max_size (inclusive).
+    return rng.integers(10, max_size, size=count, endpoint=True)
 
 # --- Main Art Generation Function ---
 
@@ -58,33 +57,33 @@ def create_abstract_art():
     # Get a drawing context. This object allows us to draw shapes and lines onto the image.
     draw = ImageDraw.Draw(image)
 
-    # Loop NUM_SHAPES times to draw multiple elements on the canvas.
-    for _ in range(NUM_SHAPES):
-        # Determine the type of shape to draw randomly.
-        # We have a few simple shapes for variety: ellipses and rectangles.
-        shape_type = random.choice(['ellipse', 'rectangle'])
-
-        # Generate random parameters for the shape.
-        # Position of the top-left corner of the bounding box for the shape.
-        pos1 = generate_random_position(WIDTH, HEIGHT)
-        # Size of the shape. This will be used to calculate the second corner.
-        size = generate_random_size(MAX_SHAPE_SIZE)
-
-        # Calculate the second position (bottom-right corner of the bounding box).
-        # We add the size to the first position.
-        pos2 = (pos1[0] + size, pos1[1] + size)
-
-        # Generate a random fill color for the shape.
-        fill_color = generate_random_color()
-
+    # Generate random parameters for all the shapes up front.
+    # Determine the type of each shape randomly.
+    # We have a few simple shapes for variety: ellipses (0) and rectangles (1).
+    shape_types = rng.integers(0, 2, size=NUM_SHAPES)
+    # Position of the top-left corner of the bounding box for each shape.
+    first_corners = generate_random_positions(NUM_SHAPES, WIDTH, HEIGHT)
+    # Size of each shape. This will be used to calculate the second corner.
+    sizes = generate_random_sizes(NUM_SHAPES, MAX_SHAPE_SIZE)
+    # Calculate the second positions (bottom-right corners of the bounding boxes).
+    # We add each size to both coordinates of its first position.
+    second_corners = first_corners + sizes[:, np.newaxis]
+    # A random fill color for each shape.
+    fill_colors = generate_random_colors(NUM_SHAPES)
+
+    # Turn the arrays into plain Python numbers, which Pillow expects.
+    shapes = zip(shape_types.tolist(), first_corners.tolist(), second_corners.tolist(), fill_colors.tolist())
+
+    # Loop over the NUM_SHAPES shapes to draw them on the canvas.
+    for shape_type, pos1, pos2, fill_color in shapes:
         # Draw the shape onto the image.
-        if shape_type == 'ellipse':
+        if shape_type == 0:
             # draw.ellipse() takes a bounding box [x0, y0, x1, y1] and fill color.
             # The bounding box defines the rectangle within which the ellipse is inscribed.
-            draw.ellipse([pos1[0], pos1[1], pos2[0], pos2[1]], fill=fill_color)
-        elif shape_type == 'rectangle':
+            draw.ellipse([pos1[0], pos1[1], pos2[0], pos2[1]], fill=tuple(fill_color))
+        else:
             # draw.rectangle() also takes a bounding box and fill color.
-            draw.rectangle([pos1[0], pos1[1], pos2[0], pos2[1]], fill=fill_color)
+            draw.rectangle([pos1[0], pos1[1], pos2[0], pos2[1]], fill=tuple(fill_color))
 
     # Return the generated image object.
     return image
@@ -99,7 +98,7 @@ if __name__ == "__main__":
 
     # Save the generated image to a file.
     # The filename includes a random component to ensure uniqueness if run multiple times.
-    filename = f"abstract_art_{random.randint(1000, 9999)}.png"
+    filename = f"abstract_art_{rng.integers(1000, 9999, endpoint=True)}.png"
     generated_art.save(filename)
 
     print(f"Art saved as: {filename}")
@@ -14,6 +14,8 @@
 # 3. Employing Matplotlib's animation module for dynamic updates.
 # 4. Managing data buffer to display a history of readings.
 
+from collections import deque
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
@@ -29,23 +31,48 @@ MAX_DATA_POINTS = 100
 # A smaller interval means faster updates, but can consume more CPU.
 UPDATE_INTERVAL_MS = 50
 
+# How often (in frames) to re-check the axis limits.
+# Blitting only redraws the line, which is fast, but whenever the axis limits
+# change the whole figure (ticks, labels, ...) has to be redrawn. So instead of
+# moving the axes a tiny bit every frame, we move them in bigger steps.
+AXIS_UPDATE_EVERY = 20
+
 # --- Data Storage ---
-# These lists will store our simulated sensor readings over time.
+# These buffers will store our simulated sensor readings over time.
 # We'll use them to keep track of the history of our data.
 # 'x_data' will store the time points (or sequential indices).
 # 'y_data' will store the actual sensor readings.
-x_data = []
-y_data = []
+# A deque with a 'maxlen' is a ring buffer: once it holds MAX_DATA_POINTS
+# items, appending a new one automatically drops the oldest. Unlike
+# list.pop(0), which shifts every remaining item along, this takes the
+# same tiny amount of time no matter how big the buffer is.
+x_data = deque(maxlen=MAX_DATA_POINTS)
+y_data = deque(maxlen=MAX_DATA_POINTS)
+
+# The smallest and largest reading currently in 'y_data'. We keep these up to
+# date as readings come and go, instead of scanning the whole buffer with
+# min() and max() on every frame. They start "empty" (infinitely large/small).
+y_min = float("inf")
+y_max = float("-inf")
+
+# The y-axis limits currently on screen, so we can skip setting them again
+# when nothing has changed.
+last_ylim = (0, 100)
 
 # --- Initialization ---
 # This function sets up the initial state of our plot.
 # It's called once at the beginning of the animation.
 def init():
+    global last_ylim
+
     # Set the limits for the x-axis. We start with an empty range.
     ax.set_xlim(0, MAX_DATA_POINTS)
     # Set the limits for the y-axis. We'll adjust this dynamically later
     # as we get more data to ensure all points are visible.
     ax.set_ylim(0, 100) # Initial guess, will auto-adjust
+    # FuncAnimation may call init() again (e.g. when the window is resized),
+    # so reset our record of the limits on screen to match.
+    last_ylim = (0, 100)
 
     # Return the plot elements that will be updated.
     # In this case, it's the line object that we'll be drawing on.
@@ -55,54 +82,71 @@ def init():
 # This function is called repeatedly by the animation framework.
 # It simulates reading a sensor, updates our data lists, and redraws the plot.
 def update(frame):
+    global y_min, y_max, last_ylim
+
     # Simulate reading a sensor value.
     # For this example, we're using a random number between 0 and 100.
     # In a real-world scenario, you would replace this with actual sensor readings
     # from a device (e.g., Arduino, Raspberry Pi, or a network API).
     current_sensor_reading = random.randint(0, 100)
 
-    # Get the current number of data points already plotted.
-    num_points = len(x_data)
-
-    # --- Data Management (Buffer) ---
-    # We want to display only the last MAX_DATA_POINTS.
-    # If we have more points than allowed, remove the oldest one.
-    if num_points >= MAX_DATA_POINTS:
-        # Remove the first element (oldest data) from both lists.
-        x_data.pop(0)
-        y_data.pop(0)
-        # After removing the oldest, we'll add the new one.
+    # The frame number counts every reading taken so far, so it makes a
+    # simple time index (0, 1, 2, ...) for the x-axis.
+    num_points = frame
 
     # --- Append New Data ---
-    # Add the new sensor reading to our data lists.
-    # For 'x_data', we use the current number of points as a simple time index.
-    # This creates a sequence like 0, 1, 2, ... which is useful for plotting.
+    # Add the new sensor reading to our data buffers.
+    # We want to display only the last MAX_DATA_POINTS. The deques take care
+    # of that: if they are full, the oldest reading is dropped automatically.
+    # Remember which reading that will be, so we can update y_min and y_max.
+    evicted_reading = y_data[0] if len(y_data) == MAX_DATA_POINTS else None
     x_data.append(num_points)
     y_data.append(current_sensor_reading)
 
+    # --- Rolling Minimum and Maximum ---
+    if evicted_reading is not None and evicted_reading in (y_min, y_max):
+        # The dropped reading was the smallest or largest one, so we don't know
+        # the new extreme without looking again. This happens only rarely.
+        y_min = min(y_data)
+        y_max = max(y_data)
+    else:
+        # Otherwise only the new reading can change the extremes.
+        y_min = min(y_min, current_sensor_reading)
+        y_max = max(y_max, current_sensor_reading)
+
     # --- Plot Update ---
     # Update the data for our line plot.
-    line.set_data(x_data, y_data)
+    # Matplotlib wants arrays, so we copy the buffers into NumPy arrays.
+    line.set_data(np.fromiter(x_data, dtype=np.float32, count=len(x_data)),
+                  np.fromiter(y_data, dtype=np.float32, count=len(y_data)))
 
     # --- Axis Auto-scaling ---
-    # Adjust the x-axis limits to match the current data range.
-    # We set the left limit to be the current number of points minus MAX_DATA_POINTS,
-    # ensuring we always see the last MAX_DATA_POINTS if available.
-    # If we have fewer than MAX_DATA_POINTS, the left limit will be 0.
-    ax.set_xlim(max(0, num_points - MAX_DATA_POINTS), num_points)
-
-    # Adjust the y-axis limits to ensure all data points are visible.
-    # We find the minimum and maximum values in our current y_data and set the
-    # y-axis limits slightly larger to provide some padding.
-    if y_data: # Only update if there's data to avoid errors on empty lists
-        min_y = min(y_data)
-        max_y = max(y_data)
-        # Add a small buffer for better visualization
-        buffer = (max_y - min_y) * 0.1
-        ax.set_ylim(max(0, min_y - buffer), max_y + buffer)
-    else:
-        # If no data, reset to a default range to avoid issues.
-        ax.set_ylim(0, 100)
+    # Only every AXIS_UPDATE_EVERY frames, or sooner if a reading falls outside
+    # the visible y range.
+    bottom, top = last_ylim
+    if frame % AXIS_UPDATE_EVERY == 0 or not bottom <= current_sensor_reading <= top:
+        # Adjust the x-axis limits to match the current data range.
+        # We show the last MAX_DATA_POINTS plus room for the next
+        # AXIS_UPDATE_EVERY points, so the line stays inside the plot until
+        # the next update. The left limit never goes below 0.
+        right = num_points + AXIS_UPDATE_EVERY
+        ax.set_xlim(max(0, right - MAX_DATA_POINTS - AXIS_UPDATE_EVERY), right)
+
+        # Adjust the y-axis limits to ensure all data points are visible.
+        # We use the minimum and maximum values in our current y_data and set the
+        # y-axis limits slightly larger to provide some padding.
+        # Add a small buffer for better visualization (at least 1, so the
+        # limits never collapse to a single value while all readings are equal,
+        # e.g. on the very first frame)
+        buffer = max((y_max - y_min) * 0.1, 1)
+        new_ylim = (max(0, y_min - buffer), y_max + buffer)
+        if new_ylim != last_ylim:
+            ax.set_ylim(*new_ylim)
+            last_ylim = new_ylim
+
+        # The axes moved, so ask for one full redraw of the figure. Blitting
+        # then picks up the new background (with its new ticks) from there.
+        ax.figure.canvas.draw_idle()
 
     # Return the plot elements that have been modified.
     # This tells the animation framework which parts of the plot need to be redrawn.
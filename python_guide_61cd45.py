@@ -41,6 +41,16 @@ def draw_circle(radius):
     """Draws a circle of a given radius."""
     artist.circle(radius) # The turtle's built-in circle drawing method.
 
+# --- Function to Pick Random Positions ---
+def random_positions(count):
+    """Returns a list of `count` random (x, y) positions inside the window."""
+    # random.choices() picks all `count` values in a single call, instead of
+    # calling random.randint() twice for every shape.
+    xs = random.choices(range(-300, 301), k=count)
+    ys = random.choices(range(-200, 201), k=count)
+    # zip() pairs them up: [(x1, y1), (x2, y2), ...]
+    return list(zip(xs, ys))
+
 # --- Main Drawing Logic ---
 def generate_art():
     """Generates art based on user input."""
@@ -69,41 +79,52 @@ def generate_art():
         artist.color("purple")
 
     # --- Drawing based on Shape Choice ---
+    # Turn off animation while drawing. Otherwise the window is redrawn after
+    # every single turtle move; this way everything appears at once when we
+    # call screen.update() at the end.
+    screen.tracer(0, 0)
+
     if shape_choice and shape_choice.lower() == "square":
         # Use a loop to draw multiple squares for a more interesting pattern.
         num_shapes = screen.numinput("Number of Shapes", "How many squares?", default=5, minval=1, maxval=20)
-        for _ in range(int(num_shapes)):
+        # Pick all the random positions up front, then just draw.
+        for position in random_positions(int(num_shapes)):
             draw_square(size)
             artist.penup() # Lift the pen so it doesn't draw while moving.
-            artist.goto(random.randint(-300, 300), random.randint(-200, 200)) # Move to a random position.
+            artist.goto(position) # Move to a random position.
             artist.pendown() # Put the pen down to start drawing again.
 
     elif shape_choice and shape_choice.lower() == "circle":
         # Draw multiple circles at random positions.
         num_shapes = screen.numinput("Number of Shapes", "How many circles?", default=5, minval=1, maxval=20)
-        for _ in range(int(num_shapes)):
+        for position in random_positions(int(num_shapes)):
             draw_circle(size)
             artist.penup()
-            artist.goto(random.randint(-300, 300), random.randint(-200, 200))
+            artist.goto(position)
             artist.pendown()
 
     elif shape_choice and shape_choice.lower() == "random":
         # A mix of shapes for fun!
         num_shapes = screen.numinput("Number of Shapes", "How many random shapes?", default=10, minval=1, maxval=30)
-        for _ in range(int(num_shapes)):
-            choice = random.choice(["square", "circle"])
+        # Pick every shape and every position up front.
+        choices = random.choices(["square", "circle"], k=int(num_shapes))
+        positions = random_positions(int(num_shapes))
+        for choice, position in zip(choices, positions):
             if choice == "square":
                 draw_square(size // 2) # Make squares a bit smaller for variety.
             else:
                 draw_circle(size // 2)
             artist.penup()
-            artist.goto(random.randint(-300, 300), random.randint(-200, 200))
+            artist.goto(position)
             artist.pendown()
 
     else:
         # If the user enters something unexpected for the shape.
         artist.write("Invalid shape choice. Please try again.", align="center", font=("Arial", 16, "normal"))
 
+    # Show everything that was drawn.
+    screen.update()
+
 # --- Trigger the Art Generation ---
 # This is where we start the process.
 generate_art()
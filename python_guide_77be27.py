@@ -5,10 +5,12 @@
 # fractal tree, using Python's Turtle graphics library and the concept of recursion.
 # You will learn:
 # 1. How to use the Python Turtle module for basic drawing.
-# 2. The fundamental concept of recursion: a function calling itself.
-# 3. How recursion can be used to create complex, self-similar patterns.
+# 2. The fundamental concept of recursion: a shape made of smaller copies of itself.
+# 3. How recursion can be used to create complex, self-similar patterns, and
+#    how an explicit stack can do the same job as recursive function calls.
 # 4. How to control the depth and angle of a fractal to observe its behavior.
 
+import math
 import turtle
 import random
 
@@ -24,69 +26,136 @@ MIN_BRANCH_LENGTH_FACTOR = 0.7  # How much shorter branches get each recursion
 ANGLE_DEGREES = 30
 BRANCH_WIDTH_INITIAL = 10
 WIDTH_DECREASE_FACTOR = 0.7
+# Batch mode: set HEADLESS to True to save the finished tree as a PostScript
+# file (EPS) and exit, instead of keeping the window open. The window is still
+# created briefly (turtle always needs one), but no time is spent waiting in
+# its event loop.
+HEADLESS = False
+OUTPUT_FILENAME = "fractal_tree.eps"
+
+# --- Fractal Tree Drawing Functions ---
+def fractal_tree_strokes(start_pos, start_heading, branch_length, level, max_level, angle, width):
+    """
+    Works out every branch of a fractal tree, without drawing anything yet.
+
+    A fractal tree is naturally described with recursion: a branch is a line
+    with two smaller trees growing out of its tip. Here we follow exactly that
+    idea, but instead of letting Python remember the unfinished forks for us
+    (one recursive call each), we keep them on our own "to-do" stack.
+
+    The two branches growing out of a fork have the same length and width and
+    meet at the fork, so we keep them together as one V-shaped "stroke"
+    (right tip -> fork -> left tip). That way each fork is a single line on
+    the canvas instead of two, halving the number of items Tk has to manage.
+
+    Args:
+        start_pos (tuple): The (x, y) turtle coordinates where the trunk starts.
+        start_heading (float): The trunk's direction in degrees (90 = up).
+        branch_length (float): The length of the first branch (the trunk).
+        level (int): The recursion depth of the first branch.
+        max_level (int): The maximum allowed recursion depth.
+        angle (float): The angle (in degrees) to turn for branches.
+        width (float): The pen width of the first branch.
+
+    Returns:
+        list: One (points, width) tuple per stroke, where points is a flat
+              tuple of turtle coordinates (x0, y0, x1, y1, ...).
+    """
+    # Every branch on the same level has the same length and width, so we work
+    # these out once per level up front, instead of multiplying again for each
+    # of the (up to 2 ** max_level) branches.
+    num_levels = max(0, max_level - level + 1)
+    lengths = [branch_length * MIN_BRANCH_LENGTH_FACTOR ** k for k in range(num_levels)]
+    widths = [width * WIDTH_DECREASE_FACTOR ** k for k in range(num_levels)]
+
+    # Stop condition: If we've reached the maximum recursion depth or the branch is too short, skip it.
+    # (A minimum length stops drawing tiny branches.)
+    def is_drawn(k):
+        return k < num_levels and lengths[k] >= 5
+
+    if not is_drawn(0):
+        return []
+
+    # The tree is symmetric: every branch points in the trunk's direction,
+    # turned left or right by `angle` a whole number of times ("turns", where
+    # left is +1 and right is -1). A branch k levels below the trunk has made
+    # between -k and +k turns, so the whole tree only ever uses
+    # 2 * num_levels - 1 different directions. We work out each direction's
+    # cos/sin once here, instead of once for every one of the branches.
+    max_turns = num_levels - 1
+    directions = []
+    for turns in range(-max_turns, max_turns + 1):
+        radians = math.radians(start_heading + turns * angle)
+        directions.append((math.cos(radians), math.sin(radians)))
+
+    def branch_end(x, y, turns, length):
+        # The end of a branch: `length` further along its direction, just like
+        # turtle's forward() would move.
+        cos_heading, sin_heading = directions[turns + max_turns]
+        return x + length * cos_heading, y + length * sin_heading
+
+    # The trunk is a stroke on its own.
+    x, y = start_pos
+    end_x, end_y = branch_end(x, y, 0, lengths[0])
+    strokes = [((x, y, end_x, end_y), widths[0])]
+
+    # The stack holds the forks still to be worked out, as
+    # (fork x, fork y, turns of the branch ending there, k of its children),
+    # where k counts the levels below the trunk, to look up the tables above.
+    stack = [(end_x, end_y, 0, 1)]
+    while stack:
+        x, y, turns, k = stack.pop()
+        if not is_drawn(k):
+            continue
+
+        # Turn right and left by `angle` for the two child branches.
+        right_x, right_y = branch_end(x, y, turns - 1, lengths[k])
+        left_x, left_y = branch_end(x, y, turns + 1, lengths[k])
+        strokes.append(((right_x, right_y, x, y, left_x, left_y), widths[k]))
+
+        # Each child's tip is a new fork.
+        stack.append((left_x, left_y, turns + 1, k + 1))
+        stack.append((right_x, right_y, turns - 1, k + 1))
+
+    return strokes
+
+def draw_strokes(screen, strokes):
+    """
+    Draws strokes (lines through several points) onto the turtle screen's canvas.
+
+    Drawing with the turtle itself means one forward() per branch, and turtle
+    does extra bookkeeping for every move. Since we already know all the lines,
+    we hand them to the underlying Tk canvas directly, one create_line each.
+
+    Args:
+        screen (turtle.Screen): The screen to draw on.
+        strokes (list): (points, width) tuples, see fractal_tree_strokes.
+    """
+    canvas = screen.getcanvas()
+    # Turtle coordinates have y pointing up, the canvas has y pointing down,
+    # so we flip y (and apply turtle's scale, which is normally 1).
+    xscale = screen.xscale
+    yscale = -screen.yscale
+    for points, width in strokes:
+        canvas_points = [value * (xscale if i % 2 == 0 else yscale) for i, value in enumerate(points)]
+        # Round line ends and corners, like the turtle's pen.
+        canvas.create_line(*canvas_points, fill=PEN_COLOR, width=width,
+                           capstyle="round", joinstyle="round")
 
-# --- Fractal Tree Drawing Function ---
 def draw_fractal_tree(t, branch_length, level, max_level, angle, width):
     """
-    Recursively draws a fractal tree.
+    Draws a fractal tree starting at the turtle's position and heading.
 
     Args:
-        t (turtle.Turtle): The Turtle object used for drawing.
-        branch_length (float): The current length of the branch to draw.
-        level (int): The current recursion depth.
+        t (turtle.Turtle): The Turtle object marking where the tree starts.
+        branch_length (float): The length of the first branch (the trunk).
+        level (int): The recursion depth of the first branch.
         max_level (int): The maximum allowed recursion depth.
         angle (float): The angle (in degrees) to turn for branches.
-        width (float): The current width of the pen for drawing.
+        width (float): The pen width of the first branch.
     """
-    # Base Case: If we've reached the maximum recursion depth or the branch is too short, stop.
-    # This is crucial for preventing infinite recursion.
-    if level > max_level or branch_length < 5: # Added a minimum length to stop drawing tiny branches
-        return
-
-    # Set the pen size for the current branch.
-    t.pensize(width)
-    # Set the color for the current branch.
-    t.pencolor(PEN_COLOR)
-
-    # Draw the current branch.
-    t.forward(branch_length)
-
-    # --- Recursive Steps ---
-    # Save the current position and heading. This is important because we'll
-    # be moving the turtle, and we need to return to this point to draw
-    # the other branches.
-    current_pos = t.pos()
-    current_heading = t.heading()
-
-    # 1. Draw the right branch:
-    # Turn right by the specified angle.
-    t.right(angle)
-    # Calculate the length of the next branch. It's shorter than the current one.
-    next_branch_length = branch_length * MIN_BRANCH_LENGTH_FACTOR
-    # Calculate the width of the next branch.
-    next_width = width * WIDTH_DECREASE_FACTOR
-    # Recursively call draw_fractal_tree for the right branch, increasing the level.
-    draw_fractal_tree(t, next_branch_length, level + 1, max_level, angle, next_width)
-
-    # Restore the position and heading to draw the left branch from the same point.
-    t.penup() # Lift the pen to avoid drawing a line while returning
-    t.goto(current_pos)
-    t.setheading(current_heading)
-    t.pendown() # Put the pen down to continue drawing
-
-    # 2. Draw the left branch:
-    # Turn left by the specified angle.
-    t.left(angle)
-    # Recursively call draw_fractal_tree for the left branch, increasing the level.
-    # We reuse the calculated next_branch_length and next_width.
-    draw_fractal_tree(t, next_branch_length, level + 1, max_level, angle, next_width)
-
-    # Restore the position and heading after drawing both branches from this point.
-    # This allows the parent call to continue drawing its other branches correctly.
-    t.penup()
-    t.goto(current_pos)
-    t.setheading(current_heading)
-    t.pendown()
+    strokes = fractal_tree_strokes(t.pos(), t.heading(), branch_length, level, max_level, angle, width)
+    draw_strokes(t.getscreen(), strokes)
 
 # --- Main Execution ---
 if __name__ == "__main__":
@@ -94,11 +163,15 @@ if __name__ == "__main__":
     screen = turtle.Screen()
     screen.setup(SCREEN_WIDTH, SCREEN_HEIGHT)
     screen.bgcolor(BACKGROUND_COLOR)
+    # Turn off animation: normally the window is redrawn after every single
+    # turtle move, which is by far the slowest part of drawing ~1000 branches.
+    # With the tracer off, nothing is shown until we call screen.update().
+    screen.tracer(0, 0)
     screen.title("Fractal Tree Explorer")
 
     # Create a Turtle object for drawing.
+    # (No need for speed(0): with the tracer off, drawing is instant anyway.)
     tree_turtle = turtle.Turtle()
-    tree_turtle.speed(0)  # Set speed to fastest (0).
     tree_turtle.hideturtle() # Hide the turtle icon while drawing.
 
     # Position the turtle at the bottom center to start drawing the tree trunk.
@@ -119,7 +192,15 @@ if __name__ == "__main__":
         ANGLE_DEGREES,
         BRANCH_WIDTH_INITIAL
     )
-
-    # Keep the window open until it's manually closed.
-    screen.mainloop()
-    print("Fractal tree drawing complete.")
\ No newline at end of file
+    # Show the finished tree, all at once.
+    screen.update()
+
+    if HEADLESS:
+        # Save the drawing and close the window right away.
+        screen.getcanvas().postscript(file=OUTPUT_FILENAME)
+        screen.bye()
+        print(f"Fractal tree saved as '{OUTPUT_FILENAME}'.")
+    else:
+        # Keep the window open until it's manually closed.
+        screen.mainloop()
+        print("Fractal tree drawing complete.")
\ No newline at end of file
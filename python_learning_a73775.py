@@ -17,6 +17,15 @@ import random
 # These will be the core of our abstract patterns.
 import math
 
+# NumPy is optional: it computes all the points at once, which is much faster.
+# Install it with: pip install numpy
+# Without it, the points are computed one by one in a regular Python loop.
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
 # --- Configuration ---
 # Define the dimensions of our artwork.
 # These variables allow for easy adjustment of the output size.
@@ -46,12 +55,87 @@ def generate_abstract_art(width, height, num_points):
     Returns:
         PIL.Image.Image: A Pillow Image object representing the generated art.
     """
-    # Create a new blank image with a black background.
-    # 'RGB' mode means we'll be working with Red, Green, Blue color channels.
-    # (0, 0, 0) is black in RGB.
-    img = Image.new('RGB', (width, height), color=(0, 0, 0))
-    # Get access to the image's pixel data for efficient modification.
-    pixels = img.load()
+    if HAVE_NUMPY:
+        return generate_abstract_art_numpy(width, height, num_points)
+    return generate_abstract_art_python(width, height, num_points)
+
+def generate_abstract_art_numpy(width, height, num_points):
+    """
+    Generates the abstract art with NumPy, computing all the points at once.
+
+    Instead of looping over the points, every step below works on whole arrays
+    of `num_points` values in a single call, so the loop runs inside NumPy's
+    fast compiled code rather than in Python.
+    """
+    rng = np.random.default_rng()
+
+    # Start from a black image, stored as an array of (height, width, RGB) bytes.
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+    # The random factors for all the points, one array for x and one for y.
+    rand_x_factors = rng.random(num_points)
+    rand_y_factors = rng.random(num_points)
+
+    # --- Mathematical Pattern Generation ---
+    # The same sine and cosine formulas as in the loop version, applied to
+    # every point at once. `astype` truncates towards zero just like `int()`.
+    x_positions = (width * (0.5 + 0.4 * np.sin(rand_x_factors * 10 * np.pi) + 0.1 * rand_x_factors)).astype(np.int32)
+    y_positions = (height * (0.5 + 0.4 * np.cos(rand_y_factors * 10 * np.pi) + 0.1 * rand_y_factors)).astype(np.int32)
+
+    # Ensure calculated coordinates are within image bounds.
+    np.clip(x_positions, 0, width - 1, out=x_positions)
+    np.clip(y_positions, 0, height - 1, out=y_positions)
+
+    # --- Random Color Generation ---
+    # One random (r, g, b) color per point.
+    colors = rng.integers(MIN_COLOR_VALUE, MAX_COLOR_VALUE, size=(num_points, 3), endpoint=True, dtype=np.uint8)
+
+    # Color all the pixels in one assignment. Like in the loop, a point that
+    # lands on an already colored pixel paints over it.
+    canvas[y_positions, x_positions] = colors
+
+    # Turn the array into a Pillow image.
+    return Image.fromarray(canvas, 'RGB')
+
+def generate_abstract_art_python(width, height, num_points):
+    """
+    Generates the abstract art one point at a time, using only plain Python.
+    This is the fallback used when NumPy is not installed.
+
+    Args:
+        width (int): The width of the image in pixels.
+        height (int): The height of the image in pixels.
+        num_points (int): The number of points to plot on the image.
+
+    Returns:
+        PIL.Image.Image: A Pillow Image object representing the generated art.
+    """
+    # Create the raw pixel data of a blank image with a black background.
+    # 'RGB' means 3 bytes per pixel: Red, Green, Blue, row after row.
+    # A new bytearray is all zeros, and (0, 0, 0) is black in RGB.
+    # Writing bytes into it directly is cheaper than setting pixels one at a
+    # time through Pillow's pixel access object.
+    buffer = bytearray(width * height * 3)
+
+    # Look up the functions we call in the loop once, and keep them in local
+    # variables. Python finds local variables faster than module attributes
+    # like `math.sin`, which adds up over thousands of iterations.
+    _sin = math.sin
+    _cos = math.cos
+    _uniform = random.uniform
+    _getrandbits = random.getrandbits
+    _randint = random.randint
+
+    # Values that are the same for every point are also worked out just once.
+    # (`width` and `height` are already fast local variables: they are parameters.)
+    ten_pi = 10 * math.pi
+    max_x = width - 1
+    max_y = height - 1
+
+    # With the full 0-255 color range, one random 24-bit number holds all three
+    # color channels (8 bits each), so we need one random call per pixel
+    # instead of three.
+    full_color_range = (MIN_COLOR_VALUE, MAX_COLOR_VALUE) == (0, 255)
 
     # Loop for a specified number of points to draw.
     # Each iteration will generate a new pixel with a potentially unique color and position.
@@ -59,8 +143,8 @@ def generate_abstract_art(width, height, num_points):
         # Generate random values that will influence the position.
         # `random.uniform` gives us floating-point numbers within a range.
         # We use `width` and `height` to scale the random values to our image dimensions.
-        rand_x_factor = random.uniform(0, 1)
-        rand_y_factor = random.uniform(0, 1)
+        rand_x_factor = _uniform(0, 1)
+        rand_y_factor = _uniform(0, 1)
 
         # --- Mathematical Pattern Generation ---
         # This is where the abstract art "magic" happens.
@@ -71,32 +155,37 @@ def generate_abstract_art(width, height, num_points):
         # `math.sin()` returns a value between -1 and 1.
         # We multiply by `width` to map this wave across the image's width.
         # Adding `rand_x_factor * width` shifts the starting point of the wave.
-        x_pos = int(width * (0.5 + 0.4 * math.sin(rand_x_factor * 10 * math.pi) + 0.1 * rand_x_factor))
+        x_pos = int(width * (0.5 + 0.4 * _sin(rand_x_factor * ten_pi) + 0.1 * rand_x_factor))
 
         # Calculate Y coordinate using cosine and random factors.
         # `math.cos()` also returns a value between -1 and 1.
         # We multiply by `height` to map this wave across the image's height.
         # Adding `rand_y_factor * height` shifts the starting point of the wave.
-        y_pos = int(height * (0.5 + 0.4 * math.cos(rand_y_factor * 10 * math.pi) + 0.1 * rand_y_factor))
+        y_pos = int(height * (0.5 + 0.4 * _cos(rand_y_factor * ten_pi) + 0.1 * rand_y_factor))
 
         # Ensure calculated coordinates are within image bounds.
         # This is a safety measure, though the formulas are designed to stay close.
-        x_pos = max(0, min(x_pos, width - 1))
-        y_pos = max(0, min(y_pos, height - 1))
+        x_pos = max(0, min(x_pos, max_x))
+        y_pos = max(0, min(y_pos, max_y))
+
+        # The pixel at (x, y) starts at byte 3 * (y * width + x):
+        # skip y full rows, then x pixels, at 3 bytes per pixel.
+        offset = 3 * (y_pos * width + x_pos)
 
         # --- Random Color Generation ---
-        # Create a random color for the current pixel.
-        # `random.randint(a, b)` returns a random integer N such that a <= N <= b.
-        r = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-        g = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-        b = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-
-        # Assign the generated color to the pixel at the calculated position.
-        # `pixels[x, y] = (r, g, b)` sets the color of the pixel at (x, y).
-        pixels[x_pos, y_pos] = (r, g, b)
-
-    # Return the completed image object.
-    return img
+        # Create a random color for the current pixel and store its three bytes.
+        if full_color_range:
+            # One random 24-bit number is exactly three random bytes:
+            # red is the lowest 8 bits, then green, then blue.
+            buffer[offset:offset + 3] = _getrandbits(24).to_bytes(3, "little")
+        else:
+            # `random.randint(a, b)` returns a random integer N such that a <= N <= b.
+            buffer[offset] = _randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
+            buffer[offset + 1] = _randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
+            buffer[offset + 2] = _randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
+
+    # Wrap the raw bytes in a Pillow image and return it.
+    return Image.frombuffer('RGB', (width, height), buffer, 'raw', 'RGB', 0, 1)
 
 # --- Example Usage ---
 
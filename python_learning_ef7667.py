@@ -7,6 +7,15 @@
 
 import random # Import the random module for generating random numbers and choices.
 
+# Basic ASCII characters for the different styles.
+# These never change, so we define them once here, instead of rebuilding
+# the lists every time a line is generated.
+CHAR_SETS = {
+    "Geometric": "-=+|/\\",   # Repeating patterns and straight lines.
+    "Organic": "~*.oO#",      # More fluid shapes and curves.
+    "Abstract": "^&$%@!",     # Freeform and less structured.
+}
+
 def get_user_input():
     """
     Prompts the user for keywords to be incorporated into the poem.
@@ -40,37 +49,46 @@ def select_artistic_style():
         else:
             print("Invalid choice. Please enter 1, 2, or 3.")
 
-def generate_line_element(style, keyword):
+def char_set_for(style):
+    """
+    Returns the characters used for a style.
+    Anything that isn't Geometric or Organic gets the Abstract set.
+    """
+    return CHAR_SETS.get(style, CHAR_SETS["Abstract"])
+
+def generate_line_element(style, keyword, char_set=None):
     """
     Generates a single ASCII art line element, influenced by the chosen style and a keyword.
     This is the core of our 'artistic algorithm'.
-    """
-    # Define basic ASCII characters for different styles.
-    geometric_chars = ['-', '=', '+', '|', '/', '\\']
-    organic_chars = ['~', '*', '.', 'o', 'O', '#']
-    abstract_chars = ['^', '&', '$', '%', '@', '!']
 
+    If the caller already looked up the style's characters (see char_set_for),
+    it can pass them in as `char_set` to skip the lookup.
+    """
     # Select the character set based on the chosen style.
-    if style == "Geometric":
-        char_set = geometric_chars
-    elif style == "Organic":
-        char_set = organic_chars
-    else: # Abstract
-        char_set = abstract_chars
+    if char_set is None:
+        char_set = char_set_for(style)
+
+    # Local names for the random functions we call more than once: looking up
+    # a local is quicker than looking up `random` and then its attribute.
+    choice = random.choice
+    randint = random.randint
 
     # Use randomness to create variation.
     # The likelihood of using a keyword character is higher.
-    char_to_use = random.choice(char_set)
+    char_to_use = choice(char_set)
     if random.random() < 0.4: # 40% chance to incorporate a keyword character.
-        char_to_use = random.choice(keyword) # Use a character from the user's keyword.
+        char_to_use = choice(keyword) # Use a character from the user's keyword.
 
     # Add some variation in length and formatting.
-    length = random.randint(5, 20) # Line length between 5 and 20 characters.
-    padding_amount = random.randint(0, 5) # Random padding for visual spacing.
+    length = randint(5, 20) # Line length between 5 and 20 characters.
+    padding_amount = randint(0, 5) # Random padding for visual spacing.
 
     # Create the line with padding.
     padding = " " * padding_amount
-    line = padding + "".join(random.choice(char_to_use) for _ in range(length)) + padding
+    # `char_to_use` is a single character, so picking `length` random characters
+    # from it would always give the same one: repeating it with `*` builds the
+    # exact same string in one step, without any random calls.
+    line = padding + char_to_use * length + padding
     return line
 
 def generate_ascii_poem(keywords, style, num_lines=5):
@@ -78,11 +96,21 @@ def generate_ascii_poem(keywords, style, num_lines=5):
     Generates the complete ASCII art poem.
     This function orchestrates the poem's structure.
     """
+    # Every line of the poem uses the same style, so look up its characters
+    # once here instead of once per line.
+    char_set = char_set_for(style)
+
+    # Bind the functions used inside the loop to local names once, so each
+    # line doesn't have to look them up again.
+    choice = random.choice
+    make_line = generate_line_element
+
     poem_lines = []
+    append_line = poem_lines.append
     for _ in range(num_lines): # Generate a specified number of lines for the poem.
         # Pick a random keyword for this line to ensure variety.
-        current_keyword = random.choice(keywords) if keywords else ""
-        poem_lines.append(generate_line_element(style, current_keyword))
+        current_keyword = choice(keywords) if keywords else ""
+        append_line(make_line(style, current_keyword, char_set))
     return "\n".join(poem_lines) # Join all generated lines with newline characters.
 
 # --- Example Usage ---
@@ -31,6 +31,18 @@ known_commands = {
     "eat": "Yum, I love food!"
 }
 
+# This dictionary stores how each built-in command changes the pet's state.
+# Each value is (change in hunger, change in energy, new mood).
+# Looking a command up here takes a single dictionary lookup, instead of
+# comparing it against every command in a long if/elif chain.
+COMMAND_EFFECTS = {
+    "play": (+1, -2, "excited"),     # Playing makes the pet hungrier and uses energy
+    "eat": (-3, +1, "satisfied"),    # Eating reduces hunger and gives some energy
+    "sleep": (0, +4, "sleepy"),      # Sleeping restores energy
+    "hello": (0, 0, "happy"),
+    "how are you": (0, 0, "happy"),
+}
+
 # --- Functions to manage the pet ---
 
 def display_pet_status(pet):
@@ -51,26 +63,22 @@ def process_command(command, pet, knowledge_base):
     """
     command = command.lower().strip() # Normalize the command: lowercase and remove whitespace
 
-    # Check if the pet knows this command
-    if command in knowledge_base:
-        response = knowledge_base[command]
+    # Check if the pet knows this command.
+    # .get() looks the command up once and gives us its response, or None if
+    # the pet doesn't know it (instead of checking `in` and then looking it up again).
+    response = knowledge_base.get(command)
+    if response is not None:
         print(f"{pet['name']} says: {response}")
 
         # --- Simple state changes based on commands ---
         # These are basic examples of how commands can affect the pet's internal state.
-        if command == "play":
-            pet["hunger"] += 1  # Playing makes the pet hungrier
-            pet["energy"] -= 2  # Playing uses energy
-            pet["mood"] = "excited"
-        elif command == "eat":
-            pet["hunger"] -= 3  # Eating reduces hunger
-            pet["energy"] += 1  # Eating gives some energy
-            pet["mood"] = "satisfied"
-        elif command == "sleep":
-            pet["energy"] += 4  # Sleeping restores energy
-            pet["mood"] = "sleepy"
-        elif command == "hello" or command == "how are you":
-            pet["mood"] = "happy"
+        # Commands the pet learned from you have no effects, so .get() returns None.
+        effects = COMMAND_EFFECTS.get(command)
+        if effects is not None:
+            hunger_change, energy_change, new_mood = effects
+            pet["hunger"] += hunger_change
+            pet["energy"] += energy_change
+            pet["mood"] = new_mood
 
         # Ensure state values stay within reasonable bounds
         pet["hunger"] = max(0, min(10, pet["hunger"]))
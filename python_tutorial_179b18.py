@@ -11,15 +11,74 @@
 # - Conditional Logic: Using if/else statements to control bot behavior.
 # - Looping: Keeping the conversation going until the user quits.
 # - String Manipulation: Basic text processing.
+# - Partial Matching: Recognising a known phrase inside a longer message.
 #
 #----------------------------------------------------------------------
 
+import functools
+import json
+import os
+import sys
+import threading
+
+# Optional: pyahocorasick (pip install pyahocorasick) finds every known phrase
+# inside a message in a single pass over the message, however many phrases
+# the bot knows. Without it, we fall back to checking each phrase in turn.
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
 # Initialize an empty dictionary to store our learned knowledge.
 # This dictionary will act as the chatbot's "memory."
 # Keys will be user inputs (what the user says), and values will be the
 # chatbot's programmed responses to those inputs.
 chatbot_knowledge = {}
 
+# A unique placeholder object, used to tell "not in the dictionary" apart from
+# any real response (even an empty one) after a single dictionary lookup.
+_MISSING = object()
+
+# What the bot says when it doesn't know an answer yet. get_bot_response hands
+# back this exact string object, so start_chat can recognise it with `is`
+# instead of searching the reply's text.
+UNKNOWN_REPLY = "I don't know how to respond to that. What should I say?"
+
+# The Aho-Corasick automaton (a kind of search machine) for all known phrases.
+# Building it takes a while, so we only build it when we need it, and
+# teach_chatbot throws it away (sets it to None) whenever a phrase is added.
+_phrase_automaton = None
+
+# --- Remembering Between Chats ---
+# The dictionary only lives as long as the program runs. To keep what the bot
+# has learned, we save it to a file as JSON (a plain text format that can hold
+# dictionaries of strings) and load it again when the next chat starts.
+# JSON files only ever contain data, so loading one can't run any code.
+KNOWLEDGE_FILE = "chatbot_knowledge.json"
+SAVE_EVERY = 5 # Save after this many new phrases (and when the chat ends).
+_unsaved_changes = 0 # How many phrases were learned since the last save.
+# Saving can happen in a background thread (see start_chat), so a lock makes
+# sure only one save writes the file at a time.
+_save_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1024)
+def _norm(text):
+    """
+    Converts text to lowercase for case-insensitive matching.
+    This makes the chatbot more forgiving; "Hello" and "hello" will be treated the same.
+
+    People tend to repeat the same phrases, so the result is remembered
+    (for up to 1024 different phrases) instead of lowercasing them again.
+
+    Args:
+        text (str): The text to normalize.
+
+    Returns:
+        str: The lowercase text, used as a key in chatbot_knowledge.
+    """
+    return text.lower()
+
 def get_bot_response(user_input):
     """
     This function determines the chatbot's response based on user input.
@@ -34,16 +93,126 @@ def get_bot_response(user_input):
         str: The chatbot's response.
     """
     # Convert user input to lowercase for case-insensitive matching.
-    # This makes the chatbot more forgiving; "Hello" and "hello" will be treated the same.
-    processed_input = user_input.lower()
+    return lookup_response(_norm(user_input))
+
+def lookup_response(processed_input):
+    """
+    Looks up the chatbot's response for input that is already lowercase
+    (see _norm).
+
+    Args:
+        processed_input (str): The lowercase message from the user.
 
-    # Check if the processed input exists as a key in our chatbot_knowledge dictionary.
-    if processed_input in chatbot_knowledge:
-        # If the key exists, retrieve and return the corresponding value (the learned response).
-        return chatbot_knowledge[processed_input]
+    Returns:
+        str: The learned response, or UNKNOWN_REPLY if there isn't one yet.
+    """
+    # Look up the processed input in our chatbot_knowledge dictionary.
+    # .get() finds the key and its value in one step (checking with `in` and
+    # then reading it with [] would search the dictionary twice), and gives
+    # back _MISSING when the key isn't there.
+    response = chatbot_knowledge.get(processed_input, _MISSING)
+    if response is not _MISSING:
+        # If the key exists, return the corresponding value (the learned response).
+        return response
     else:
-        # If the input is not in our knowledge base, we need to ask the user to teach us.
-        return "I don't know how to respond to that. What should I say?"
+        # Not an exact match: maybe the message contains a phrase we know.
+        # If not, this returns UNKNOWN_REPLY and the user can teach us.
+        return find_partial_response(processed_input)
+
+def _prepare_phrase_search():
+    """
+    Builds the Aho-Corasick automaton for all known phrases, if it isn't built
+    yet (only used when pyahocorasick is installed).
+    """
+    global _phrase_automaton
+    if HAVE_AHOCORASICK and _phrase_automaton is None:
+        automaton = ahocorasick.Automaton()
+        for phrase in chatbot_knowledge:
+            if phrase: # An empty phrase would "match" everywhere.
+                automaton.add_word(phrase, len(phrase))
+        automaton.make_automaton()
+        _phrase_automaton = automaton
+
+def _iter_known_phrases(text):
+    """
+    Finds every known phrase (key of chatbot_knowledge) inside the text.
+
+    Args:
+        text (str): The lowercase message to search.
+
+    Yields:
+        tuple: (start, end) positions of each phrase found, so that
+               text[start:end] is the phrase.
+    """
+    if HAVE_AHOCORASICK:
+        _prepare_phrase_search()
+        if len(_phrase_automaton) == 0:
+            return # Nothing to search for (and an empty automaton can't search).
+        # iter() reports where each phrase ends, and we stored its length.
+        for end_index, length in _phrase_automaton.iter(text):
+            yield end_index + 1 - length, end_index + 1
+    else:
+        for phrase in chatbot_knowledge:
+            if not phrase:
+                continue
+            start = text.find(phrase)
+            while start != -1:
+                yield start, start + len(phrase)
+                start = text.find(phrase, start + 1)
+
+def find_partial_response(processed_input):
+    """
+    Looks for a known phrase inside a longer message, e.g. "hello" in
+    "hello bot!", and returns the response for it. Phrases only count as
+    whole words ("hi" is not found in "this"), and the longest phrase wins.
+
+    Args:
+        processed_input (str): The lowercase message from the user.
+
+    Returns:
+        str: The learned response for the phrase found, or UNKNOWN_REPLY.
+    """
+    best_start, best_end = 0, 0
+    for start, end in _iter_known_phrases(processed_input):
+        if end - start <= best_end - best_start:
+            continue # We already found a longer phrase.
+        # Whole words only: the characters just before and after the phrase
+        # (if any) must not be letters or digits.
+        if start > 0 and processed_input[start - 1].isalnum():
+            continue
+        if end < len(processed_input) and processed_input[end].isalnum():
+            continue
+        best_start, best_end = start, end
+
+    if best_end == 0:
+        return UNKNOWN_REPLY
+    return chatbot_knowledge[processed_input[best_start:best_end]]
+
+def get_bot_responses_batch(inputs):
+    """
+    Gets the chatbot's responses for many messages at once, e.g. to replay a
+    saved conversation or to check what the bot has learned.
+    Gives the same answers as calling get_bot_response for each message.
+
+    Args:
+        inputs (list): The messages (str) from the user.
+
+    Returns:
+        list: The chatbot's response (str) for each message, in order.
+    """
+    # map(str.lower, ...) lowercases all the messages without running any
+    # Python code per message, and the local names save looking up
+    # chatbot_knowledge.get and UNKNOWN_REPLY again for every message.
+    knowledge_get = chatbot_knowledge.get
+    unknown_reply = UNKNOWN_REPLY
+    processed_inputs = list(map(str.lower, inputs))
+    responses = [knowledge_get(text, unknown_reply) for text in processed_inputs]
+
+    # Only messages without an exact match need the slower phrase search.
+    for i, response in enumerate(responses):
+        if response is unknown_reply:
+            responses[i] = find_partial_response(processed_inputs[i])
+    return responses
 
 def teach_chatbot(user_input, bot_response):
     """
@@ -56,13 +225,111 @@ def teach_chatbot(user_input, bot_response):
         bot_response (str): The response the user wants the bot to give for that input.
     """
     # Convert the user's input to lowercase to ensure consistent learning.
-    processed_input = user_input.lower()
+    # The keys are always stored lowercase, so lookups never see mixed case.
+    processed_input = _norm(user_input)
 
     # Add the new key-value pair to the dictionary.
     # The user's input becomes the key, and the bot's desired response becomes the value.
     chatbot_knowledge[processed_input] = bot_response
+    # The phrase search needs rebuilding to include the new phrase.
+    global _phrase_automaton, _unsaved_changes
+    _phrase_automaton = None
     print("Thank you! I've learned that.")
 
+    # Count the new phrase: writing the file after every single phrase would
+    # be wasteful, so start_chat saves once every SAVE_EVERY new phrases.
+    _unsaved_changes += 1
+
+def save_knowledge(filename=KNOWLEDGE_FILE):
+    """
+    Saves everything the chatbot has learned to a file.
+
+    Args:
+        filename (str): The file to save to.
+
+    Raises:
+        OSError: If the file couldn't be written (e.g. the disk is full or
+                 the folder is read-only). The unsaved changes are kept, so
+                 a later save can try again.
+    """
+    global _unsaved_changes
+    with _save_lock:
+        # Write to a temporary file first, then swap it in: if the program stops
+        # halfway through writing, the previous save is still intact.
+        temp_filename = filename + ".tmp"
+        try:
+            with open(temp_filename, "w", encoding="utf-8") as file:
+                json.dump(chatbot_knowledge, file, ensure_ascii=False)
+            os.replace(temp_filename, filename)
+        except OSError:
+            # Don't leave a half-written temporary file behind.
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+            raise
+        _unsaved_changes = 0
+
+def load_knowledge(filename=KNOWLEDGE_FILE):
+    """
+    Loads what the chatbot learned in earlier chats, if it was saved.
+
+    Args:
+        filename (str): The file to load from.
+
+    Returns:
+        bool: True if knowledge was loaded, False if there was no file yet
+              (or it couldn't be read, in which case we start from scratch).
+    """
+    global _phrase_automaton
+    try:
+        with open(filename, encoding="utf-8") as file:
+            loaded_knowledge = json.load(file)
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError) as error:
+        # ValueError covers json.JSONDecodeError (a damaged or half-written
+        # file) and text that isn't valid UTF-8.
+        print(f"(Couldn't read {filename}: {error}. Starting with an empty memory.)")
+        return False
+
+    # The file must hold a dictionary of phrase -> response strings.
+    if not (isinstance(loaded_knowledge, dict)
+            and all(isinstance(key, str) and isinstance(value, str)
+                    for key, value in loaded_knowledge.items())):
+        print(f"(Couldn't read {filename}: unexpected contents. Starting with an empty memory.)")
+        return False
+
+    # Fill the existing dictionary (rather than replacing it), so every part
+    # of the program keeps using the same one.
+    chatbot_knowledge.clear()
+    chatbot_knowledge.update(loaded_knowledge)
+    _phrase_automaton = None
+    return True
+
+def _has_chores():
+    """
+    Tells whether there is work for _use_think_time to do.
+    """
+    return (HAVE_AHOCORASICK and _phrase_automaton is None) or _unsaved_changes >= SAVE_EVERY
+
+def _use_think_time(save_errors):
+    """
+    Chores that can be done while the user is reading and typing: building
+    the phrase search for the latest phrases, and saving new lessons to disk
+    once there are SAVE_EVERY of them. Doing them now means the user never
+    has to wait for them.
+
+    Args:
+        save_errors (list): Any OSError from saving is added to this list,
+                            so the main program can report it (errors in a
+                            background thread would otherwise go unnoticed).
+    """
+    _prepare_phrase_search()
+    if _unsaved_changes >= SAVE_EVERY:
+        try:
+            save_knowledge()
+        except OSError as error:
+            save_errors.append(error)
+
 def start_chat():
     """
     This function starts the main chat loop.
@@ -71,30 +338,83 @@ def start_chat():
     """
     print("Hello! I'm a simple chatbot that learns. Type 'quit' to exit.")
 
+    # Remember what we learned in earlier chats.
+    if load_knowledge():
+        print(f"(Remembered from earlier chats: {len(chatbot_knowledge)} phrase(s).)")
+
+    # The loop below runs once per message, so we give the things it uses on
+    # every turn local names first. Python finds local names faster than
+    # module-level ("global") ones.
+    # chatbot_knowledge.get(key, UNKNOWN_REPLY) returns the learned response,
+    # or UNKNOWN_REPLY itself when there isn't one: the same answer as
+    # lookup_response, in a single call.
+    knowledge_get = chatbot_knowledge.get
+    find_partial = find_partial_response
+    norm = _norm
+    unknown_reply = UNKNOWN_REPLY
+    # sys.stdout.write() writes exactly the text it is given, skipping the
+    # extra work print() does to join its arguments and add the line ending.
+    # (input() makes sure everything written so far is shown before it waits.)
+    write = sys.stdout.write
+
     # Start an infinite loop to keep the conversation going.
     while True:
+        # While the user is thinking and typing, the program would otherwise
+        # just sit and wait. So if there are chores to do, we start them in a
+        # background thread (a second line of work running at the same time).
+        # daemon=True means the thread never keeps the program from exiting.
+        chores = None
+        save_errors = []
+        if _has_chores():
+            chores = threading.Thread(target=_use_think_time, args=(save_errors,), daemon=True)
+            chores.start()
+
         # Get input from the user. The input() function pauses the program
         # and waits for the user to type something and press Enter.
         user_message = input("You: ")
 
+        # Make sure the chores are finished before we use the knowledge again.
+        if chores is not None:
+            chores.join()
+            for error in save_errors:
+                write(f"(Couldn't save what I've learned: {error}. I'll try again later.)\n")
+
+        # Lowercase the message once, and use it both for the quit check and
+        # for looking up the bot's response.
+        processed_message = norm(user_message)
+
         # Check if the user wants to quit the conversation.
-        if user_message.lower() == 'quit':
-            print("Bot: Goodbye!")
+        if processed_message == 'quit':
+            if _unsaved_changes:
+                # Don't forget the latest lessons. (Any background save has
+                # already finished: we joined the chores thread above.)
+                try:
+                    save_knowledge()
+                except OSError as error:
+                    write(f"(Couldn't save what I've learned: {error}.)\n")
+            write("Bot: Goodbye!\n")
+            sys.stdout.flush() # Show the goodbye before the program ends.
             break # Exit the while loop, ending the chat.
 
         # Get the bot's initial response using the knowledge we have.
-        bot_reply = get_bot_response(user_message)
+        bot_reply = knowledge_get(processed_message, unknown_reply)
+        if bot_reply is unknown_reply:
+            # Not an exact match: look for a known phrase inside the message.
+            bot_reply = find_partial(processed_message)
 
         # If the bot's reply indicates it needs to learn, handle the learning process.
-        if "What should I say?" in bot_reply:
-            print(f"Bot: {bot_reply}")
+        # (`is` checks that it is the very same object, which is instant, and
+        # also means a learned reply that happens to use the same words
+        # doesn't start the teaching again.)
+        if bot_reply is unknown_reply:
+            write("Bot: " + bot_reply + "\n")
             # Prompt the user for the correct response.
             new_response = input("Bot: ")
             # Teach the chatbot the new input-response pair.
             teach_chatbot(user_message, new_response)
         else:
             # If the bot knows the answer, just print its learned response.
-            print(f"Bot: {bot_reply}")
+            write("Bot: " + bot_reply + "\n")
 
 # --- Example Usage ---
 # To run this code:
@@ -102,6 +422,8 @@ def start_chat():
 # 2. Open a terminal or command prompt.
 # 3. Navigate to the directory where you saved the file.
 # 4. Run the script using: python learning_chatbot.py
+# What the bot learns is saved to chatbot_knowledge.json next to where you run
+# it; delete that file to start over with an empty memory.
 
 # The 'if __name__ == "__main__":' block ensures that the start_chat() function
 # is called only when the script is executed directly (not when it's imported
@@ -117,6 +439,9 @@ if __name__ == "__main__":
 # You: hello
 # Bot: Hi there!
 #
+# You: hello bot
+# Bot: Hi there!
+#
 # You: how are you
 # Bot: I don't know how to respond to that. What should I say?
 # Bot: I'm a bot, so I don't have feelings!
@@ -4,80 +4,211 @@
 # to dynamically change the color of data points based on a selected column from their dataset.
 # This demonstrates a fundamental concept in interactive visualization: user-driven data exploration.
 
-# Import necessary libraries
-# We need pandas for data manipulation and plotly.express for creating interactive plots easily.
-import pandas as pd
-import plotly.express as px
+# Importing pandas and Plotly takes a noticeable moment, so we only import
+# them inside the functions that need them. That way, importing this file
+# (e.g. to reuse recolor() in a notebook) is quick, and the cost is only paid
+# when we actually load data or build a plot.
 
 # --- Step 1: Load and Prepare Your Data ---
 # For this tutorial, we'll create a sample DataFrame. In a real-world scenario,
 # you would load your data from a CSV, Excel file, or database using pandas.
 # Creating a DataFrame with diverse data types to showcase color mapping.
-data = {
-    'X_Axis': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-    'Y_Axis': [5, 6, 4, 7, 3, 8, 2, 9, 1, 10],
-    'Category': ['A', 'B', 'A', 'C', 'B', 'A', 'C', 'B', 'A', 'C'],
-    'Value': [100, 150, 120, 180, 110, 200, 130, 160, 140, 190]
+# The sample values never change, so we write them down once, as tuples
+# (which can't be changed by accident), and only turn them into a DataFrame
+# when load_data() is called.
+SAMPLE_DATA = {
+    'X_Axis': (1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+    'Y_Axis': (5, 6, 4, 7, 3, 8, 2, 9, 1, 10),
+    'Category': ('A', 'B', 'A', 'C', 'B', 'A', 'C', 'B', 'A', 'C'),
+    'Value': (100, 150, 120, 180, 110, 200, 130, 160, 140, 190)
 }
-df = pd.DataFrame(data)
-
-# Display the first few rows of the DataFrame to understand its structure.
-# This helps in identifying which columns can be used for plotting.
-print("--- Sample DataFrame ---")
-print(df.head())
-print("\n")
-
-# --- Step 2: Create the Interactive Scatter Plot ---
-# Plotly Express (px) is a high-level interface for Plotly, making it easy
-# to create common plot types with minimal code.
-
-# We are creating a scatter plot.
-# 'df' is our pandas DataFrame.
-# 'x' specifies the column for the x-axis.
-# 'y' specifies the column for the y-axis.
-# 'color' is the key to interactivity! When a user selects a column here,
-# Plotly will color the points based on the values in that column.
-# 'hover_data' allows us to display additional information when hovering over a point.
-# 'title' provides a descriptive title for our visualization.
-fig = px.scatter(df,
-                 x="X_Axis",
-                 y="Y_Axis",
-                 color="Category",  # Initially coloring by 'Category'
-                 hover_data=['Value'], # Display 'Value' on hover
-                 title="Interactive Scatter Plot: Explore Data by Category")
-
-# --- Step 3: Enhance Interactivity (Optional but Recommended) ---
-# Plotly figures have a 'update_layout' method to customize the appearance
-# and interactive features. Here, we're enabling a more interactive feel.
-
-fig.update_layout(
-    # The legend in Plotly is interactive by default, allowing users to click
-    # on legend items to hide/show corresponding data points.
-    # This layout update is more about general plot aesthetics and might not
-    # be strictly necessary for basic interactivity but good to know.
-    # For this specific example, the primary interactivity comes from the 'color' argument.
-    # You could add more complex controls with Dash, but for Plotly Express,
-    # the 'color' parameter is the main driver for dynamic coloring.
-)
-
-# --- Step 4: Display the Visualization ---
-# The 'fig.show()' method renders the interactive plot.
-# This will typically open the plot in your default web browser or
-# display it inline if you are using an environment like Jupyter Notebook.
-print("--- Displaying Interactive Plot ---")
-print("The plot should open in your browser or display inline.")
-fig.show()
+
+def load_data():
+    """
+    Creates the sample data for this tutorial as a pandas DataFrame.
+
+    Every call returns a new DataFrame, so changing one (build_figure does)
+    never affects another.
+
+    Returns:
+        pd.DataFrame: The sample data.
+    """
+    # We need pandas for data manipulation.
+    import pandas as pd
+
+    return pd.DataFrame({column: list(values) for column, values in SAMPLE_DATA.items()})
+
+def build_figure(df):
+    """
+    Builds the interactive scatter plot, with one trace per 'Category'.
+    The DataFrame itself is left unchanged.
+
+    Args:
+        df (pd.DataFrame): The data from load_data().
+
+    Returns:
+        go.Figure: The finished figure, ready for fig.show().
+    """
+    # NumPy for fast arrays, and plotly.graph_objects for building the
+    # interactive plot trace by trace.
+    import numpy as np
+    import plotly.graph_objects as go
+
+    # --- Step 2: Create the Interactive Scatter Plot ---
+    # Plotly Express (px.scatter) could build this plot from the DataFrame in one
+    # call, but it does a lot of work behind the scenes: it inspects every column,
+    # converts the categories to text and then splits the data into one "trace"
+    # (one set of points with its own color and legend entry) per category.
+    # Here we do that splitting ourselves and hand Plotly plain arrays, which is
+    # what it needs in the end anyway.
+
+    # Before plotting, we take copies of the columns in compact types (kept in
+    # our own variables, so the caller's DataFrame stays as it was):
+    # - 'category' stores each distinct category name once, plus a small integer
+    #   code per row, so grouping compares numbers instead of strings.
+    # - float32 numbers take half the memory of the default 64-bit ones, which is
+    #   plenty of precision for plotting.
+    category_column = df['Category'].astype('category')
+    x_values = df['X_Axis'].to_numpy(dtype=np.float32)
+    y_values = df['Y_Axis'].to_numpy(dtype=np.float32)
+    point_values = df['Value'].to_numpy(dtype=np.float32)
+
+    # Group the points by 'Category': for every category we collect its
+    # x values, y values and 'Value's as NumPy arrays.
+    # Instead of asking pandas for one group at a time, we sort the rows by
+    # their category code once. Then every category's rows sit next to each
+    # other, and each group is just a slice of the sorted arrays.
+    categories = category_column.cat.categories
+    codes = category_column.cat.codes.to_numpy()
+    # 'stable' keeps rows of the same category in their original order.
+    order = np.argsort(codes, kind='stable')
+    # bounds[i] is where category i's rows start in the sorted order (and
+    # bounds[i + 1] is where they end). Rows without a category (code -1)
+    # sort to the front and fall outside every slice.
+    bounds = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+    sorted_x = x_values[order]
+    sorted_y = y_values[order]
+    sorted_values = point_values[order]
+
+    groups = {}
+    for i, category in enumerate(categories):
+        start, end = bounds[i], bounds[i + 1]
+        if start == end:
+            continue # Skip categories that have no rows.
+        groups[category] = (sorted_x[start:end],
+                            sorted_y[start:end],
+                            sorted_values[start:end])
+
+    # Start with an empty figure and add one trace per category.
+    # 'Scattergl' is a scatter plot drawn with WebGL (the graphics card) instead
+    # of one SVG element per point, so it stays smooth even with many points.
+    # 'mode="markers"' draws dots without connecting lines.
+    # 'customdata' carries extra values for each point ('Value' here), which the
+    # 'hovertemplate' shows when hovering over a point.
+    # Each trace gets its own color from Plotly's default palette, and its 'name'
+    # appears in the legend, so the points are colored by 'Category'.
+    # Categories don't have to be text (your own CSV may use numbers), so we
+    # turn each one into a string for the legend and the hover text.
+    fig = go.Figure()
+    for category, (xs, ys, values) in groups.items():
+        category_name = str(category)
+        fig.add_trace(go.Scattergl(
+            x=xs,
+            y=ys,
+            mode="markers",
+            name=category_name,
+            customdata=values[:, None],
+            hovertemplate=("Category=" + category_name + "<br>X_Axis=%{x}<br>Y_Axis=%{y}"
+                           "<br>Value=%{customdata[0]}<extra></extra>"),
+        ))
+
+    # 'title' provides a descriptive title for our visualization, and the axis and
+    # legend titles tell the reader which columns they are looking at.
+    fig.update_layout(title="Interactive Scatter Plot: Explore Data by Category",
+                      xaxis_title="X_Axis",
+                      yaxis_title="Y_Axis",
+                      legend_title_text="Category")
+
+    # --- Step 3: Enhance Interactivity (Optional but Recommended) ---
+    # Plotly figures have a 'update_layout' method to customize the appearance
+    # and interactive features. Here, we're enabling a more interactive feel.
+
+    fig.update_layout(
+        # The legend in Plotly is interactive by default, allowing users to click
+        # on legend items to hide/show corresponding data points.
+        # This layout update is more about general plot aesthetics and might not
+        # be strictly necessary for basic interactivity but good to know.
+        # For this specific example, the primary interactivity comes from the
+        # per-category traces: clicking a category in the legend hides or shows it.
+        # You could add more complex controls with Dash.
+    )
+
+    return fig
+
+# --- Changing the Colors Later ---
+# Building a new figure to color by another column makes the browser throw
+# away the whole plot and draw it again from scratch. Instead, we can keep the
+# figure we have and only change its marker colors: Plotly then just updates
+# what changed. In a Jupyter Notebook, wrap the figure as
+# go.FigureWidget(fig) and display it once; after that, calling recolor()
+# updates the plot in place.
+
+def recolor(fig, df, column, group_column="Category"):
+    """
+    Colors the points of an existing figure by a numeric column of the DataFrame.
+
+    Each trace holds the rows of one group (e.g. one 'Category'), so we pick
+    those rows' values from `column`. All traces share one color scale, so
+    the same value gets the same color in every trace.
+
+    Args:
+        fig: The figure built above (a go.Figure or go.FigureWidget).
+        df: The DataFrame the figure was built from.
+        column: The name of the numeric column to color the points by.
+        group_column: The column the traces were split by.
+    """
+    # batch_update() collects all the changes and sends them to the plot in
+    # one go, instead of one update per trace.
+    with fig.batch_update():
+        fig.update_layout(coloraxis=dict(colorscale="Viridis", colorbar_title_text=column))
+        for trace in fig.data:
+            # Trace names are strings, so compare them with the groups as strings.
+            rows = df[group_column].astype(str) == trace.name
+            trace.marker.color = df.loc[rows, column].to_numpy()
+            trace.marker.coloraxis = "coloraxis"
+
+if __name__ == "__main__":
+    df = load_data()
+
+    # Display the first few rows of the DataFrame to understand its structure.
+    # This helps in identifying which columns can be used for plotting.
+    # head() picks out only the first 5 rows, so only those are turned into text;
+    # to_string() prints them directly, without the row numbers (index), and
+    # limits the output to 4 columns in case you load a wider dataset.
+    print("--- Sample DataFrame ---")
+    print(df.head().to_string(index=False, max_cols=4))
+    print("\n")
+
+    fig = build_figure(df)
+
+    # --- Step 4: Display the Visualization ---
+    # The 'fig.show()' method renders the interactive plot.
+    # This will typically open the plot in your default web browser or
+    # display it inline if you are using an environment like Jupyter Notebook.
+    # Before showing it, Plotly converts the whole figure to JSON text for the
+    # browser. Tip: `pip install orjson` for a much faster JSON converter.
+    # Plotly uses it automatically when it is installed (its default JSON
+    # engine, "auto", picks orjson if available and the built-in json otherwise).
+    print("--- Displaying Interactive Plot ---")
+    print("The plot should open in your browser or display inline.")
+    fig.show()
 
 # --- Example Usage and Further Exploration ---
 # To explore the data visually by a different column (e.g., 'Value'),
-# you would simply re-run the 'px.scatter' function with a different 'color' argument.
-# For instance, to color by 'Value':
-# fig_by_value = px.scatter(df,
-#                           x="X_Axis",
-#                           y="Y_Axis",
-#                           color="Value", # Color by the numerical 'Value' column
-#                           hover_data=['Category'],
-#                           title="Interactive Scatter Plot: Explore Data by Value")
-# fig_by_value.show()
-# This demonstrates how easily you can pivot your visualization based on different
-# data attributes directly within Plotly Express.
\ No newline at end of file
+# you don't need to build a new figure: recolor the one you have.
+# For instance, to color by 'Value' with a color scale:
+# recolor(fig, df, "Value")
+# fig.show()
+# The legend still lets you hide or show each category, while the colors now
+# show the 'Value' of every point. This demonstrates how easily you can pivot
+# your visualization based on different data attributes.